@@ -24,6 +24,8 @@ class AgentOrchestrator:
     def __init__(self):
         """Initialize orchestrator with KeenAgent"""
         self.agent: Optional[KeenAgent] = None
+        # Caps in-flight model calls so a multi-pair fan-out stays within provider limits
+        self.semaphore = asyncio.Semaphore(config.get('ai.max_concurrency', 4))
         self.initialize_agent()
     
     def initialize_agent(self):
@@ -80,6 +82,49 @@ class AgentOrchestrator:
             print(f"❌ Error analyzing market: {e}")
             return None
     
+    async def analyze_markets(
+        self,
+        contexts: Dict[str, MarketContext]
+    ) -> Dict[str, Optional[AgentPrediction]]:
+        """
+        Analyze several markets concurrently
+        
+        Latency is that of the slowest call rather than the sum of all calls.
+        A failed analysis yields a HOLD prediction with zero confidence so the
+        pair still appears in the result.
+        
+        Args:
+            contexts: Dictionary mapping pair to MarketContext
+            
+        Returns:
+            Dictionary mapping pair to AgentPrediction (None if agent unavailable)
+        """
+        if not self.agent:
+            print("⚠️ KeenAgent not available")
+            return {pair: None for pair in contexts}
+        
+        async def bounded(context: MarketContext) -> Optional[AgentPrediction]:
+            async with self.semaphore:
+                return await self.analyze_market(context)
+        
+        results = await asyncio.gather(
+            *(bounded(context) for context in contexts.values()),
+            return_exceptions=True
+        )
+        
+        predictions = {}
+        for pair, result in zip(contexts, results):
+            if isinstance(result, AgentPrediction):
+                predictions[pair] = result
+            else:
+                predictions[pair] = AgentPrediction(
+                    agent_name=self.agent.name,
+                    signal=OrderDirection.HOLD,
+                    confidence=0.0,
+                    reasoning=f"Analysis failed: {result}" if result else "Analysis failed"
+                )
+        return predictions
+    
     def _log_decision(self, context: MarketContext, prediction: AgentPrediction):
         """Log agent decision for debugging"""
         print(f"\n🤖 KeenAgent Decision for {context.pair}:")
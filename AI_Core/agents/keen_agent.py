@@ -4,15 +4,14 @@ Uses OpenRouter with DeepSeek V3.2 (or any other model)
 Supports easy model switching and tool calling
 """
 
-from openai import OpenAI
 from typing import Optional, Dict, Any
 from datetime import datetime
 import time
 import json
-import asyncio
 import os
 
 from backend.models.trading_models import MarketContext, AgentPrediction, OrderDirection
+from AI_Core.models.openrouter import chat_completion
 from .base_agent import BaseAgent
 
 
@@ -41,12 +40,6 @@ class KeenAgent(BaseAgent):
         
         super().__init__(name='KeenAgent', api_key=api_key, model=model, timeout=timeout)
         
-        # Initialize OpenAI client with OpenRouter base URL
-        self.client = OpenAI(
-            base_url=self.base_url,
-            api_key=api_key
-        )
-        
         # Optional headers for OpenRouter rankings
         self.extra_headers = {
             "HTTP-Referer": site_url,
@@ -123,30 +116,25 @@ Be decisive and data-driven."""
             # Build prompt
             prompt = self._build_trading_prompt(context)
             
-            # Make API call using OpenAI SDK with OpenRouter
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are an expert trading analyst. Provide clear, decisive trading signals based on technical analysis. Always respond in the exact format requested."
-                        },
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ],
-                    temperature=0.7,
-                    max_tokens=300,
-                    extra_headers=self.extra_headers
-                )
+            # Make API call through the shared OpenRouter connection pool
+            response_text = await chat_completion(
+                self.api_key,
+                self.model,
+                [
+                    {
+                        "role": "system",
+                        "content": "You are an expert trading analyst. Provide clear, decisive trading signals based on technical analysis. Always respond in the exact format requested."
+                    },
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ],
+                extra_headers=self.extra_headers,
+                temperature=0.7,
+                max_tokens=300
             )
             
-            # Extract response
-            response_text = response.choices[0].message.content
-            
             # Parse response
             parsed = self._parse_response(response_text)
             if not parsed:
@@ -306,22 +294,18 @@ Volatility & Support/Resistance:
             user_message = f"{market_data}\n\nUser Question: {user_query if user_query else 'Analyze current market conditions'}"
             
             # Make API call
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_message}
-                    ],
-                    temperature=0.7,
-                    max_tokens=500,
-                    extra_headers=self.extra_headers
-                )
+            response_text = await chat_completion(
+                self.api_key,
+                self.model,
+                [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_message}
+                ],
+                extra_headers=self.extra_headers,
+                temperature=0.7,
+                max_tokens=500
             )
-            
-            # Extract response
-            response_text = response.choices[0].message.content.strip()
+            response_text = response_text.strip()
             
             # Record success
             self.successful_calls += 1
@@ -113,7 +113,7 @@ class AgentPerformanceTracker:
             'sharpe_ratio': sharpe_ratio
         }
     
-    def update_database(self, agent_name: str):
+    async def update_database(self, agent_name: str):
         """
         Update agent performance in database
         
@@ -122,15 +122,12 @@ class AgentPerformanceTracker:
         """
         metrics = self.calculate_metrics(agent_name)
         
-        session = db.get_session()
-        try:
-            AgentPerformanceDAL.update_performance(
+        async with db.get_async_session() as session:
+            await AgentPerformanceDAL.update_performance(
                 session=session,
                 agent_name=agent_name,
                 metrics=metrics
             )
-        finally:
-            session.close()
     
     def get_all_agent_metrics(self, days: int = 30) -> Dict[str, Dict]:
         """
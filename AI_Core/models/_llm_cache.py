@@ -0,0 +1,37 @@
+"""
+Completion cache for OpenRouter calls
+Identical prompts within a short window reuse the stored reply
+"""
+
+from hashlib import blake2b
+from typing import Any, Dict, List, Optional
+
+import orjson
+from cachetools import TTLCache
+
+# Replies expire quickly so analysis never runs on stale market data
+LLM_CACHE_TTL = 60  # seconds
+LLM_CACHE_SIZE = 1024
+
+_cache: TTLCache = TTLCache(maxsize=LLM_CACHE_SIZE, ttl=LLM_CACHE_TTL)
+
+
+def cache_key(model: str, messages: List[Dict[str, str]], params: Dict[str, Any]) -> bytes:
+    """Stable digest of everything that determines a completion"""
+    payload = orjson.dumps([model, messages, params], option=orjson.OPT_SORT_KEYS)
+    return blake2b(payload, digest_size=16).digest()
+
+
+def get(key: bytes) -> Optional[str]:
+    """Cached reply for a key, or None"""
+    return _cache.get(key)
+
+
+def put(key: bytes, reply: str):
+    """Store a reply"""
+    _cache[key] = reply
+
+
+def clear():
+    """Drop all cached replies"""
+    _cache.clear()
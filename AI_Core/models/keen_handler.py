@@ -4,9 +4,10 @@ Uses OpenRouter with DeepSeek models
 """
 
 import os
-from openai import OpenAI
 from dotenv import load_dotenv
 
+from .openrouter import chat_completion
+
 load_dotenv()
 
 
@@ -29,54 +30,53 @@ class KeenHandler:
         if not api_key:
             raise ValueError("OpenRouter API key not found. Set the OPENROUTER_API_KEY environment variable.")
 
-        self.client = OpenAI(
-            api_key=api_key,
-            base_url="https://openrouter.ai/api/v1"
-        )
+        self.api_key = api_key
         self.model = model
 
-    def analyze_market(self, market_data, news_data):
+    async def _complete(self, system, user, no_cache=False):
+        """Send a system/user exchange through the shared OpenRouter client"""
+        return await chat_completion(
+            self.api_key,
+            self.model,
+            [
+                {"role": "system", "content": system},
+                {"role": "user", "content": user},
+            ],
+            no_cache=no_cache,
+        )
+
+    async def analyze_market(self, market_data, news_data, no_cache=False):
         """
         Analyze market data and news
         
         Args:
             market_data: Market data dictionary
             news_data: News data
+            no_cache: Skip the completion cache and always call the model
             
         Returns:
             Analysis string
         """
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": "You are an expert trading analyst."},
-                {"role": "user", "content": f"Analyze the following market data and news: {market_data}, {news_data}"},
-            ],
-            stream=False,
+        return await self._complete(
+            "You are an expert trading analyst.",
+            f"Analyze the following market data and news: {market_data}, {news_data}",
+            no_cache=no_cache,
         )
-        return response.choices[0].message.content
 
-    def explain(self, prompt):
+    async def explain(self, prompt, no_cache=False):
         """
         Explain a trading concept or decision
         
         Args:
             prompt: Question or topic to explain
+            no_cache: Skip the completion cache and always call the model
             
         Returns:
             Explanation string
         """
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": "You are a helpful trading assistant."},
-                {"role": "user", "content": prompt},
-            ],
-            stream=False,
-        )
-        return response.choices[0].message.content
+        return await self._complete("You are a helpful trading assistant.", prompt, no_cache=no_cache)
 
-    def analyze_sentiment_batch(self, news_texts):
+    async def analyze_sentiment_batch(self, news_texts):
         """
         Analyze sentiment of news texts
         
@@ -89,17 +89,13 @@ class KeenHandler:
         # Simple sentiment analysis using AI
         prompt = f"Analyze the sentiment of these news items and return a score from -1 (very negative) to 1 (very positive):\n\n{news_texts}"
         
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": "You are a sentiment analysis expert. Return only a number between -1 and 1."},
-                {"role": "user", "content": prompt},
-            ],
-            stream=False,
+        content = await self._complete(
+            "You are a sentiment analysis expert. Return only a number between -1 and 1.",
+            prompt,
         )
         
         try:
-            score = float(response.choices[0].message.content.strip())
+            score = float(content.strip())
             return {"score": max(-1.0, min(1.0, score))}
         except:
             return {"score": 0.0}
@@ -0,0 +1,89 @@
+"""
+OpenRouter HTTP client for KeenAI-Quant
+One shared async connection pool for all chat completion calls
+"""
+
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from . import _llm_cache
+
+# Optional HTTP/2 support (httpx[http2]) - falls back to HTTP/1.1 keep-alive
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
+REQUEST_TIMEOUT = 30.0  # seconds
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Get the shared OpenRouter client, creating it on first use"""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            base_url=OPENROUTER_BASE_URL,
+            http2=HTTP2_AVAILABLE,
+            timeout=REQUEST_TIMEOUT,
+            limits=httpx.Limits(max_keepalive_connections=32)
+        )
+    return _client
+
+
+async def chat_completion(
+    api_key: str,
+    model: str,
+    messages: List[Dict[str, str]],
+    extra_headers: Optional[Dict[str, str]] = None,
+    no_cache: bool = False,
+    **params: Any
+) -> str:
+    """
+    Run a chat completion and return the reply text
+
+    Identical requests within LLM_CACHE_TTL seconds are answered from an
+    in-memory cache instead of a new round trip.
+
+    Args:
+        api_key: OpenRouter API key
+        model: Model ID (e.g., 'deepseek/deepseek-r1:free')
+        messages: Chat messages
+        extra_headers: Additional request headers
+        no_cache: Always call the provider and skip the completion cache
+        **params: Extra completion parameters (temperature, max_tokens, ...)
+
+    Returns:
+        Content of the first choice's message
+    """
+    key = _llm_cache.cache_key(model, messages, params)
+    if not no_cache:
+        reply = _llm_cache.get(key)
+        if reply is not None:
+            return reply
+
+    headers = {"Authorization": f"Bearer {api_key}"}
+    if extra_headers:
+        headers.update(extra_headers)
+
+    response = await get_client().post(
+        "/chat/completions",
+        json={"model": model, "messages": messages, **params},
+        headers=headers
+    )
+    response.raise_for_status()
+    reply = response.json()["choices"][0]["message"]["content"]
+    _llm_cache.put(key, reply)
+    return reply
+
+
+async def close_client():
+    """Close the shared OpenRouter client"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -6,7 +6,7 @@ Manages open positions and P&L tracking
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
-from backend.models.trading_models import Position, OrderDirection
+from backend.models.trading_models import Position, PositionBook, OrderDirection
 
 # Optional OpenAlgo wrapper for fallback
 try:
@@ -41,6 +41,12 @@ class PositionManager:
         self.positions: Dict[str, Position] = {}
         self.closed_positions: List[Position] = []
         
+        # Vectorized prices/P&L; Position objects are synced from it lazily
+        self.book = PositionBook()
+        self._positions_stale = False
+        # Running total, refreshed whenever the book's P&L changes
+        self._total_pnl_cache = 0.0
+        
         print(f"📊 PositionManager initialized")
     
     def update_positions(self) -> bool:
@@ -71,6 +77,8 @@ class PositionManager:
                 if position:
                     self.positions[position.pair] = position
             
+            self._rebuild_book()
+            
             print(f"📊 Updated {len(self.positions)} positions")
             return True
             
@@ -138,6 +146,18 @@ class PositionManager:
             print(f"⚠️ Error parsing position: {e}")
             return None
     
+    def _rebuild_book(self) -> None:
+        """Rebuild the position book after positions were added or removed"""
+        self.book = PositionBook(list(self.positions.values()))
+        self._positions_stale = False
+        self._total_pnl_cache = self.book.total_unrealized_pnl
+    
+    def _sync_positions(self) -> None:
+        """Copy prices and P&L from the book onto the Position objects"""
+        if self._positions_stale:
+            self.book.apply_to(self.positions)
+            self._positions_stale = False
+    
     def get_position(self, pair: str) -> Optional[Position]:
         """
         Get position for a specific pair
@@ -148,6 +168,7 @@ class PositionManager:
         Returns:
             Position object or None
         """
+        self._sync_positions()
         return self.positions.get(pair)
     
     def get_all_positions(self) -> List[Position]:
@@ -157,6 +178,7 @@ class PositionManager:
         Returns:
             List of positions
         """
+        self._sync_positions()
         return list(self.positions.values())
     
     def close_position(self, pair: str) -> bool:
@@ -178,9 +200,11 @@ class PositionManager:
             
             if success:
                 # Move to closed positions
+                self._sync_positions()
                 position = self.positions[pair]
                 self.closed_positions.append(position)
                 del self.positions[pair]
+                self._rebuild_book()
                 
                 print(f"✅ Position closed: {pair}")
                 print(f"   P&L: ${position.unrealized_pnl:.2f}")
@@ -200,9 +224,9 @@ class PositionManager:
         Args:
             price_updates: Dictionary mapping pair to current price
         """
-        for pair, price in price_updates.items():
-            if pair in self.positions:
-                self.positions[pair].update_price(price)
+        if self.book.set_prices(price_updates):
+            self._positions_stale = True
+            self._total_pnl_cache = self.book.total_unrealized_pnl
     
     def check_stop_loss(self) -> List[str]:
         """
@@ -212,6 +236,7 @@ class PositionManager:
             List of pairs that hit stop-loss
         """
         hit_stop_loss = []
+        self._sync_positions()
         
         for pair, position in self.positions.items():
             if position.stop_loss == 0:
@@ -234,6 +259,7 @@ class PositionManager:
             List of pairs that hit take-profit
         """
         hit_take_profit = []
+        self._sync_positions()
         
         for pair, position in self.positions.items():
             if position.take_profit == 0:
@@ -260,6 +286,11 @@ class PositionManager:
             'take_profit': self.check_take_profit()
         }
     
+    @property
+    def total_unrealized_pnl(self) -> float:
+        """Total unrealized P&L across all positions (maintained on update, O(1))"""
+        return self._total_pnl_cache
+    
     def calculate_total_pnl(self) -> float:
         """
         Calculate total unrealized P&L across all positions
@@ -267,7 +298,7 @@ class PositionManager:
         Returns:
             Total unrealized P&L
         """
-        return sum(pos.unrealized_pnl for pos in self.positions.values())
+        return self._total_pnl_cache
     
     def get_position_stats(self) -> Dict[str, Any]:
         """
@@ -276,6 +307,7 @@ class PositionManager:
         Returns:
             Dictionary with position stats
         """
+        self._sync_positions()
         total_positions = len(self.positions)
         profitable = sum(1 for pos in self.positions.values() if pos.is_profitable)
         losing = total_positions - profitable
@@ -6,7 +6,9 @@ Aggregates data, indicators, and market regime into MarketContext for AI analysi
 from typing import List, Optional
 from datetime import datetime
 
-from backend.models.trading_models import MarketContext, Candle, Position
+from backend.models.trading_models import (
+    MarketContext, Candle, CandleSeries, Position, IndicatorState
+)
 from .technical_analysis.indicators import calculate_indicators
 from .technical_analysis.market_regime import MarketRegimeDetector
 from .data_acquisition import data_acquisition
@@ -67,11 +69,13 @@ class ContextBuilder:
                 pair=pair,
                 current_price=current_price,
                 indicators=indicators,
-                recent_candles=candles[-100:],  # Last 100 candles
+                recent_candles=CandleSeries.from_candles(candles, max_len=100),  # Last 100 candles
                 current_positions=pair_positions,
                 account_balance=account_balance,
                 market_regime=regime,
-                timestamp=datetime.now()
+                timestamp=datetime.now(),
+                # Lets push_candle() roll indicators forward without a full recompute
+                indicator_state=IndicatorState.from_candles(candles)
             )
             
             return context
@@ -205,14 +205,12 @@ class DataAcquisition:
                     self.buffers[pair][timeframe].append(candle)
                 
                 # Also save to database for persistence
-                session = db.get_session()
                 try:
-                    for candle in candles[-100:]:  # Save last 100 to DB
-                        CandleDAL.insert_candle(session, candle)
+                    async with db.get_async_session() as session:
+                        # Save last 100 to DB in one batch
+                        await CandleDAL.insert_candles_bulk(session, candles[-100:])
                 except Exception as e:
                     print(f"⚠️ Error saving candles to DB: {e}")
-                finally:
-                    session.close()
         
         print("✅ Buffers populated")
     
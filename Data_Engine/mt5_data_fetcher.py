@@ -7,6 +7,7 @@ import logging
 from typing import List, Optional
 from datetime import datetime, timedelta
 from backend.models.trading_models import Candle
+from backend.models._kernels import validate_candles
 
 logger = logging.getLogger(__name__)
 
@@ -103,20 +104,7 @@ class MT5DataFetcher:
                 logger.warning(f"No data returned for {pair} {timeframe}")
                 return []
             
-            # Convert to Candle objects
-            candles = []
-            for rate in rates:
-                candle = Candle(
-                    pair=pair,
-                    timestamp=datetime.fromtimestamp(rate['time']),
-                    timeframe=timeframe,
-                    open=float(rate['open']),
-                    high=float(rate['high']),
-                    low=float(rate['low']),
-                    close=float(rate['close']),
-                    volume=float(rate['tick_volume'])
-                )
-                candles.append(candle)
+            candles = self._rates_to_candles(rates, pair, timeframe)
             
             logger.info(f"Fetched {len(candles)} candles for {pair} {timeframe}")
             return candles
@@ -125,6 +113,35 @@ class MT5DataFetcher:
             logger.error(f"Error fetching historical data: {e}")
             return []
     
+    def _rates_to_candles(self, rates, pair: str, timeframe: str) -> List[Candle]:
+        """
+        Convert an MT5 rates array to Candle objects
+        
+        OHLC consistency is checked for the whole batch in one vectorized
+        pass; malformed bars are skipped instead of failing the fetch.
+        """
+        valid = validate_candles(rates['open'], rates['high'], rates['low'], rates['close'])
+        if not valid.all():
+            logger.warning(f"Skipping {int((~valid).sum())} malformed bars for {pair} {timeframe}")
+            rates = rates[valid]
+        
+        # Convert to Candle objects
+        candles = []
+        for rate in rates:
+            candle = Candle(
+                pair=pair,
+                timestamp=datetime.fromtimestamp(rate['time']),
+                timeframe=timeframe,
+                open=float(rate['open']),
+                high=float(rate['high']),
+                low=float(rate['low']),
+                close=float(rate['close']),
+                volume=float(rate['tick_volume'])
+            )
+            candles.append(candle)
+        
+        return candles
+    
     def fetch_recent_candles(
         self,
         pair: str,
@@ -171,22 +188,7 @@ class MT5DataFetcher:
                 logger.warning(f"No data returned for {pair} {timeframe}")
                 return []
             
-            # Convert to Candle objects
-            candles = []
-            for rate in rates:
-                candle = Candle(
-                    pair=pair,
-                    timestamp=datetime.fromtimestamp(rate['time']),
-                    timeframe=timeframe,
-                    open=float(rate['open']),
-                    high=float(rate['high']),
-                    low=float(rate['low']),
-                    close=float(rate['close']),
-                    volume=float(rate['tick_volume'])
-                )
-                candles.append(candle)
-            
-            return candles
+            return self._rates_to_candles(rates, pair, timeframe)
             
         except Exception as e:
             logger.error(f"Error fetching recent candles: {e}")
@@ -0,0 +1,146 @@
+"""
+API Middleware
+CORS handling with a fast path for always-polled endpoints
+"""
+
+from typing import Iterable, List, Optional
+
+from starlette.middleware.cors import SAFELISTED_HEADERS, CORSMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class FastPathCORSMiddleware:
+    """
+    CORS middleware that answers hot endpoints with precomputed headers
+    
+    Requests to fast_paths from an allowed origin get fixed CORS headers
+    without the generic middleware's per-request header parsing. Everything
+    else, including disallowed origins and preflights asking for a method or
+    header outside the allow-lists, goes through a regular CORSMiddleware
+    built from the same options, so behaviour is unchanged.
+    """
+    
+    def __init__(
+        self,
+        app: ASGIApp,
+        allow_origins: Iterable[str],
+        allow_methods: Iterable[str],
+        fast_paths: Iterable[str] = ("/", "/health"),
+        allow_headers: Iterable[str] = (),
+        allow_credentials: bool = False,
+        expose_headers: Iterable[str] = (),
+        max_age: int = 600
+    ):
+        self.app = app
+        self.cors = CORSMiddleware(
+            app,
+            allow_origins=list(allow_origins),
+            allow_methods=list(allow_methods),
+            allow_headers=list(allow_headers),
+            allow_credentials=allow_credentials,
+            expose_headers=list(expose_headers),
+            max_age=max_age
+        )
+        self.fast_paths = frozenset(fast_paths)
+        self.allow_origins = frozenset(o.encode("latin-1") for o in allow_origins)
+        self.mirror_request_headers = "*" in allow_headers
+        
+        # Preflight allow-lists, matched the way CORSMiddleware matches them
+        self.allow_all_methods = "*" in allow_methods
+        self.allowed_methods = frozenset(m.encode("latin-1") for m in allow_methods)
+        self.allowed_headers = frozenset(
+            h.lower().encode("latin-1") for h in (*SAFELISTED_HEADERS, *allow_headers)
+        )
+        
+        # Header tuples computed once and reused for every fast-path response
+        shared = [(b"vary", b"Origin")]
+        if allow_credentials:
+            shared.append((b"access-control-allow-credentials", b"true"))
+        
+        self.simple_headers = list(shared)
+        if expose_headers:
+            self.simple_headers.append(
+                (b"access-control-expose-headers", ", ".join(expose_headers).encode("latin-1"))
+            )
+        
+        self.preflight_headers = shared + [
+            (b"access-control-allow-methods", ", ".join(allow_methods).encode("latin-1")),
+            (b"access-control-max-age", str(max_age).encode("latin-1")),
+            (b"content-type", b"text/plain; charset=utf-8"),
+            (b"content-length", b"2")
+        ]
+        if allow_headers and not self.mirror_request_headers:
+            self.preflight_headers.append(
+                (b"access-control-allow-headers", ", ".join(allow_headers).encode("latin-1"))
+            )
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            # CORSMiddleware only handles HTTP; websockets go straight through
+            await self.app(scope, receive, send)
+            return
+        
+        if scope["path"] not in self.fast_paths:
+            await self.cors(scope, receive, send)
+            return
+        
+        origin = None
+        request_method = None
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+        
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+        
+        if origin not in self.allow_origins:
+            await self.cors(scope, receive, send)
+            return
+        
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            if self._preflight_allowed(request_method, request_headers):
+                await self._preflight(origin, request_headers, send)
+            else:
+                # Let CORSMiddleware build the rejection
+                await self.cors(scope, receive, send)
+            return
+        
+        await self.app(scope, receive, self._with_headers(send, origin))
+    
+    def _preflight_allowed(self, request_method: bytes, request_headers: Optional[bytes]) -> bool:
+        """Check a preflight's requested method and headers against the allow-lists"""
+        if not self.allow_all_methods and request_method not in self.allowed_methods:
+            return False
+        if self.mirror_request_headers or not request_headers:
+            return True
+        return all(
+            h.strip().lower() in self.allowed_headers
+            for h in request_headers.split(b",")
+            if h.strip()
+        )
+    
+    async def _preflight(self, origin: bytes, request_headers: Optional[bytes], send: Send):
+        """Answer a CORS preflight with the precomputed headers"""
+        headers: List = [(b"access-control-allow-origin", origin)] + self.preflight_headers
+        if self.mirror_request_headers and request_headers:
+            headers.append((b"access-control-allow-headers", request_headers))
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": b"OK"})
+    
+    def _with_headers(self, send: Send, origin: bytes) -> Send:
+        """Wrap send to add CORS headers to the response start message"""
+        async def send_with_cors(message: Message):
+            if message["type"] == "http.response.start":
+                message["headers"] = (
+                    list(message.get("headers", []))
+                    + [(b"access-control-allow-origin", origin)]
+                    + self.simple_headers
+                )
+            await send(message)
+        return send_with_cors
@@ -3,6 +3,7 @@ AI Agents API Routes
 Get AI agent performance and statistics
 """
 
+import logging
 from fastapi import APIRouter, HTTPException
 from typing import Dict, List
 from pydantic import BaseModel
@@ -10,6 +11,7 @@ from pydantic import BaseModel
 from AI_Core.agents.agent_orchestrator import agent_orchestrator
 from AI_Core.agents.performance_tracker import performance_tracker
 
+logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
@@ -68,9 +70,7 @@ async def get_agent_performance():
             for agent_name, data in performance_data.items()
         ]
     except Exception as e:
-        print(f"❌ Error getting agent performance: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error getting agent performance: %s", e)
         # Return empty list instead of error
         return []
 
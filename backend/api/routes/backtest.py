@@ -3,6 +3,7 @@ Backtesting API Routes
 Run and manage strategy backtests
 """
 
+import logging
 from fastapi import APIRouter, HTTPException
 from typing import List, Optional
 from datetime import date, datetime
@@ -14,6 +15,7 @@ from Strategy_Framework.mean_reversion_strategy import MeanReversionStrategy
 from Strategy_Framework.breakout_strategy import BreakoutStrategy
 from backend.models.trading_models import Candle
 
+logger = logging.getLogger(__name__)
 router = APIRouter()
 
 # Global backtest engine
@@ -78,7 +80,7 @@ async def run_backtest(request: BacktestRequest):
         )
         
         # Load historical data
-        print(f"📊 Loading historical data for {request.pair} from {start_date} to {end_date}")
+        logger.info("Loading historical data for %s from %s to %s", request.pair, start_date, end_date)
         historical_data = _load_historical_data(request.pair, start_date, end_date)
         
         if not historical_data or len(historical_data) < 50:
@@ -87,7 +89,7 @@ async def run_backtest(request: BacktestRequest):
                 detail=f"Insufficient historical data (got {len(historical_data)} candles, need at least 50)"
             )
         
-        print(f"✅ Loaded {len(historical_data)} candles, running backtest...")
+        logger.info("Loaded %s candles, running backtest...", len(historical_data))
         
         # Run backtest
         result = backtest_engine.run(config, historical_data)
@@ -96,7 +98,7 @@ async def run_backtest(request: BacktestRequest):
         backtest_id = f"bt_{datetime.now().timestamp()}"
         backtest_results[backtest_id] = result
         
-        print(f"✅ Backtest complete: {result.total_return:.2f}% return, {len(result.trades)} trades")
+        logger.info("Backtest complete: %.2f%% return, %s trades", result.total_return, len(result.trades))
         
         return BacktestResponse(
             backtest_id=backtest_id,
@@ -107,9 +109,7 @@ async def run_backtest(request: BacktestRequest):
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-        print(f"❌ Backtest error: {e}")
-        traceback.print_exc()
+        logger.exception("Backtest error: %s", e)
         raise HTTPException(status_code=500, detail=f"Backtest failed: {str(e)}")
 
 
@@ -162,13 +162,13 @@ def _load_historical_data(pair: str, start_date: date, end_date: date) -> List[C
         )
         
         if candles and len(candles) > 0:
-            print(f"✅ Loaded {len(candles)} real candles from MT5 for backtest")
+            logger.info("Loaded %s real candles from MT5 for backtest", len(candles))
             return candles
         
-        print(f"⚠️ No MT5 data available, generating sample data")
+        logger.warning("No MT5 data available, generating sample data")
         
     except Exception as e:
-        print(f"⚠️ Error fetching MT5 data: {e}, using sample data")
+        logger.warning("Error fetching MT5 data: %s, using sample data", e)
     
     # Fallback: Generate valid sample data
     from datetime import timedelta
@@ -220,7 +220,7 @@ def _load_historical_data(pair: str, start_date: date, end_date: date) -> List[C
         current_date += timedelta(hours=1)
         base_price = close_price
     
-    print(f"✅ Generated {len(candles)} sample candles for backtest")
+    logger.info("Generated %s sample candles for backtest", len(candles))
     return candles
 
 
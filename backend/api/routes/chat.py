@@ -3,6 +3,7 @@ Chat API Routes
 Handle chat interactions with Keen Agent
 """
 
+import logging
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import Optional
@@ -10,6 +11,7 @@ from datetime import datetime
 
 from backend.models.trading_models import MarketContext
 
+logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
@@ -31,7 +33,7 @@ async def chat_with_agent(request: ChatRequest):
         from Broker_Integration.account_manager import account_manager
         from Broker_Integration.position_manager import position_manager
         
-        print(f"💬 Chat request: {request.message}")
+        logger.info("Chat request: %s", request.message)
         
         # Initialize Keen Agent
         keen_agent = KeenAgent()
@@ -41,7 +43,7 @@ async def chat_with_agent(request: ChatRequest):
         positions = position_manager.get_all_positions()
         balance = account.balance if account else 10000.0
         
-        print(f"📊 Building market context (Balance: ${balance:,.2f}, Positions: {len(positions)})")
+        logger.info("Building market context (Balance: $%.2f, Positions: %s)", balance, len(positions))
         
         # Determine which pair to analyze based on user query
         query_lower = request.message.lower()
@@ -57,9 +59,9 @@ async def chat_with_agent(request: ChatRequest):
         # Try to fetch data from MT5 first
         from Data_Engine.mt5_data_fetcher import mt5_data_fetcher
         
-        print(f"🔌 Checking MT5 connection...")
+        logger.info("Checking MT5 connection...")
         if not mt5_data_fetcher.mt5_client or not mt5_data_fetcher.mt5_client.connected:
-            print("⚠️ MT5 not connected, attempting to connect...")
+            logger.warning("MT5 not connected, attempting to connect...")
             if mt5_data_fetcher.mt5_client:
                 mt5_data_fetcher.mt5_client.connect()
         
@@ -73,7 +75,7 @@ async def chat_with_agent(request: ChatRequest):
         
         if not context:
             # Try other pairs if target fails
-            print(f"⚠️ Failed to build context for {target_pair}, trying alternatives...")
+            logger.warning("Failed to build context for %s, trying alternatives...", target_pair)
             for pair in ["EUR/USD", "XAU/USD", "BTC/USD", "ETH/USD"]:
                 if pair != target_pair:
                     context = context_builder.build_context(
@@ -83,12 +85,12 @@ async def chat_with_agent(request: ChatRequest):
                         current_positions=positions
                     )
                     if context:
-                        print(f"✅ Using context for {pair}")
+                        logger.info("Using context for %s", pair)
                         break
         
         if not context:
             # Last resort: Create minimal context for AI to respond
-            print("⚠️ No market data available, creating minimal context...")
+            logger.warning("No market data available, creating minimal context...")
             context = MarketContext(
                 pair=target_pair,
                 current_price=1.0850 if target_pair == "EUR/USD" else 2050.0,
@@ -111,9 +113,9 @@ async def chat_with_agent(request: ChatRequest):
                 market_regime="unknown",
                 timestamp=datetime.now()
             )
-            print("⚠️ Using minimal context - AI will note data unavailability")
+            logger.warning("Using minimal context - AI will note data unavailability")
         
-        print(f"🤖 Calling AI model with context for {context.pair}...")
+        logger.info("Calling AI model with context for %s...", context.pair)
         
         # Get response from Keen Agent - THIS IS THE REAL AI CALL
         agent_response = await keen_agent.analyze_and_decide(
@@ -136,14 +138,12 @@ async def chat_with_agent(request: ChatRequest):
                 detail="AI model returned empty response"
             )
         
-        print(f"✅ AI response generated ({len(response_text)} chars)")
+        logger.info("AI response generated (%s chars)", len(response_text))
         
         return ChatResponse(response=response_text)
         
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Chat error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Chat error: %s", e)
         raise HTTPException(status_code=500, detail=f"Chat system error: {str(e)}")
@@ -3,17 +3,43 @@ Performance API Routes
 Get system and strategy performance metrics
 """
 
-from fastapi import APIRouter, HTTPException
+import logging
+from fastapi import APIRouter, HTTPException, Response
+from functools import lru_cache
 from typing import Dict, List
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+import numpy as np
+import orjson
 
-from Strategy_Framework.strategy_orchestrator import strategy_orchestrator
+from backend.core.cache import cached, single_flight
 
+logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+# Heavy components are imported on first use to keep worker startup cheap
+@lru_cache(maxsize=1)
+def _strategy_orchestrator():
+    from Strategy_Framework.strategy_orchestrator import strategy_orchestrator
+    return strategy_orchestrator
+
+
+@lru_cache(maxsize=1)
+def _orchestrator():
+    from main_orchestrator import main_orchestrator
+    return main_orchestrator
+
+
+@lru_cache(maxsize=1)
+def _account_manager():
+    from Broker_Integration.account_manager import account_manager
+    return account_manager
+
+
 # Response Models
 class StrategyPerformanceResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    
     name: str
     type: str
     enabled: bool
@@ -24,14 +50,19 @@ class StrategyPerformanceResponse(BaseModel):
     avg_pnl_per_signal: float
 
 
+_strategies_adapter = TypeAdapter(List[StrategyPerformanceResponse])
+
+
 @router.get("/strategies", response_model=List[StrategyPerformanceResponse])
+@cached(ttl=15)
 async def get_strategy_performance():
     """Get performance metrics for all strategies"""
     try:
-        metrics = strategy_orchestrator.get_all_performance_metrics()
+        metrics = _strategy_orchestrator().get_all_performance_metrics()
         
-        return [
-            StrategyPerformanceResponse(
+        # Metrics come from the orchestrator, so skip re-validation
+        items = [
+            StrategyPerformanceResponse.model_construct(
                 name=data['name'],
                 type=data['type'],
                 enabled=data['enabled'],
@@ -43,17 +74,21 @@ async def get_strategy_performance():
             )
             for strategy_name, data in metrics.items()
         ]
+        return Response(
+            content=_strategies_adapter.dump_json(items, exclude_none=True),
+            media_type="application/json"
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/system")
+@single_flight(ttl=1)
+@cached(ttl=5)
 async def get_system_performance():
     """Get overall system performance"""
     try:
-        from main_orchestrator import main_orchestrator
-        
-        status = main_orchestrator.get_system_status()
+        status = _orchestrator().get_system_status()
         
         return {
             "total_updates": status.get('total_updates', 0),
@@ -70,11 +105,10 @@ async def get_system_performance():
 async def get_equity_curve():
     """Get equity curve data for performance chart"""
     try:
-        from Broker_Integration.account_manager import account_manager
         from datetime import datetime, timedelta
         
         # Get account info
-        account = account_manager.get_account()
+        account = _account_manager().get_account()
         
         if not account:
             # Return sample data if no account
@@ -89,23 +123,27 @@ async def get_equity_curve():
             from backend.database import db
             from backend.database.dal import PerformanceDAL
             
-            session = db.get_session()
-            perf_dal = PerformanceDAL(session)
-            
-            # Get last 30 days of equity data
-            start_date = datetime.now() - timedelta(days=30)
-            equity_data = perf_dal.get_equity_curve(start_date)
-            
-            session.close()
+            async with db.get_async_session() as session:
+                # Get last 30 days of equity data as columnar arrays. The window bounds
+                # the response, and the DAL streams it in FETCH_BATCH_SIZE round trips.
+                start_date = datetime.now() - timedelta(days=30)
+                timestamps, equity, balance = await PerformanceDAL.get_equity_curve(session, start_date)
             
-            if equity_data:
-                return {
-                    "timestamps": [point['timestamp'].isoformat() for point in equity_data],
-                    "equity": [point['equity'] for point in equity_data],
-                    "balance": [point['balance'] for point in equity_data]
-                }
+            if len(timestamps):
+                # Format all timestamps in one vectorized C pass instead of per-point isoformat().
+                # Snapshots are stored as naive local time, so no timezone suffix is added.
+                iso = np.datetime_as_string(timestamps.view("datetime64[ns]"), unit="ms")
+                content = orjson.dumps(
+                    {
+                        "timestamps": iso.tolist(),
+                        "equity": equity,
+                        "balance": balance
+                    },
+                    option=orjson.OPT_SERIALIZE_NUMPY
+                )
+                return Response(content=content, media_type="application/json")
         except Exception as db_error:
-            print(f"⚠️ Database not available for equity curve: {db_error}")
+            logger.warning("Database not available for equity curve: %s", db_error)
         
         # Fallback: Return current snapshot
         return {
@@ -115,5 +153,5 @@ async def get_equity_curve():
         }
         
     except Exception as e:
-        print(f"❌ Error getting equity curve: {e}")
+        logger.exception("Error getting equity curve: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
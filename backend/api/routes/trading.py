@@ -3,19 +3,41 @@ Trading API Routes
 Control trading system and get trading information
 """
 
-from fastapi import APIRouter, HTTPException
+import logging
+from fastapi import APIRouter, HTTPException, Response
+from fastapi.responses import StreamingResponse
+from functools import lru_cache
+import asyncio
 from typing import List, Optional
 from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+import msgspec
 
-from main_orchestrator import main_orchestrator
-from Broker_Integration.account_manager import account_manager
-from Broker_Integration.position_manager import position_manager
-from Broker_Integration.order_manager import order_manager
+from backend.core.cache import cached, single_flight
 
+logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+# Heavy components are imported on first use to keep worker startup cheap
+@lru_cache(maxsize=1)
+def _orchestrator():
+    from main_orchestrator import main_orchestrator
+    return main_orchestrator
+
+
+@lru_cache(maxsize=1)
+def _account_manager():
+    from Broker_Integration.account_manager import account_manager
+    return account_manager
+
+
+@lru_cache(maxsize=1)
+def _position_manager():
+    from Broker_Integration.position_manager import position_manager
+    return position_manager
+
+
 # Request/Response Models
 class TradingControlResponse(BaseModel):
     success: bool
@@ -33,6 +55,8 @@ class AccountResponse(BaseModel):
 
 
 class PositionResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    
     position_id: str
     pair: str
     direction: str
@@ -45,32 +69,63 @@ class PositionResponse(BaseModel):
 
 
 class TradeResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    
+    trade_id: str
+    pair: str
+    direction: str
+    size: float
+    entry_price: float
+    exit_price: Optional[float] = None
+    pnl: Optional[float] = None
+    opened_at: datetime
+    closed_at: Optional[datetime] = None
+    status: str
+
+
+class TradeStruct(msgspec.Struct, kw_only=True, omit_defaults=True):
+    """Wire format for trade history (TradeResponse documents it in OpenAPI)"""
     trade_id: str
     pair: str
     direction: str
     size: float
     entry_price: float
-    exit_price: Optional[float]
-    pnl: Optional[float]
-    opened_at: str
-    closed_at: Optional[str]
+    exit_price: Optional[float] = None
+    pnl: Optional[float] = None
+    opened_at: datetime
+    closed_at: Optional[datetime] = None
     status: str
 
 
+# List serializers: one C-level call per response instead of one per row
+_positions_adapter = TypeAdapter(List[PositionResponse])
+_trade_encoder = msgspec.json.Encoder()
+
+
+# Trade history requests above this size are streamed row by row
+TRADES_STREAM_THRESHOLD = 1000
+
+
+def _json_response(content: bytes) -> Response:
+    """Wrap pre-serialized JSON bytes in a response"""
+    return Response(content=content, media_type="application/json")
+
+
 @router.post("/start", response_model=TradingControlResponse)
 async def start_trading():
     """Start the trading system"""
     try:
-        if main_orchestrator.state.value == "RUNNING":
+        orchestrator = _orchestrator()
+        
+        if orchestrator.state.value == "RUNNING":
             return TradingControlResponse(
                 success=False,
                 message="Trading system is already running",
-                state=main_orchestrator.state.value
+                state=orchestrator.state.value
             )
         
         # Start trading in background
-        import asyncio
-        asyncio.create_task(main_orchestrator.start_trading())
+        asyncio.create_task(orchestrator.start_trading())
         
         return TradingControlResponse(
             success=True,
@@ -85,19 +140,21 @@ async def start_trading():
 async def stop_trading():
     """Stop the trading system"""
     try:
-        if main_orchestrator.state.value == "STOPPED":
+        orchestrator = _orchestrator()
+        
+        if orchestrator.state.value == "STOPPED":
             return TradingControlResponse(
                 success=False,
                 message="Trading system is already stopped",
-                state=main_orchestrator.state.value
+                state=orchestrator.state.value
             )
         
-        await main_orchestrator.stop_trading()
+        await orchestrator.stop_trading()
         
         return TradingControlResponse(
             success=True,
             message="Trading system stopped successfully",
-            state=main_orchestrator.state.value
+            state=orchestrator.state.value
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -107,12 +164,14 @@ async def stop_trading():
 async def pause_trading():
     """Pause the trading system"""
     try:
-        await main_orchestrator.pause_trading()
+        orchestrator = _orchestrator()
+        
+        await orchestrator.pause_trading()
         
         return TradingControlResponse(
             success=True,
             message="Trading system paused",
-            state=main_orchestrator.state.value
+            state=orchestrator.state.value
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -122,32 +181,37 @@ async def pause_trading():
 async def resume_trading():
     """Resume the trading system"""
     try:
-        await main_orchestrator.resume_trading()
+        orchestrator = _orchestrator()
+        
+        await orchestrator.resume_trading()
         
         return TradingControlResponse(
             success=True,
             message="Trading system resumed",
-            state=main_orchestrator.state.value
+            state=orchestrator.state.value
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/status")
+@single_flight(ttl=0.5)
 async def get_status():
     """Get trading system status"""
     try:
-        return main_orchestrator.get_system_status()
+        return _orchestrator().get_system_status()
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/account", response_model=AccountResponse)
+@single_flight(ttl=2)
+@cached(ttl=3)
 async def get_account():
     """Get account information"""
     try:
         # Try to get account from account manager
-        account = account_manager.get_account()
+        account = _account_manager().get_account()
         
         if account:
             return AccountResponse(
@@ -163,11 +227,14 @@ async def get_account():
         try:
             from Broker_Integration.broker_service import broker_service
             
-            success, response_data, status_code = broker_service.get_account_info()
+            # MT5 calls block, so run them off the event loop
+            success, response_data, status_code = await asyncio.to_thread(
+                broker_service.get_account_info
+            )
             
             if success and 'data' in response_data:
                 account_data = response_data['data']
-                print(f"✅ Got account from broker service - Balance: ${account_data['balance']}")
+                logger.info("Got account from broker service - Balance: $%s", account_data['balance'])
                 return AccountResponse(
                     balance=account_data['balance'],
                     equity=account_data['equity'],
@@ -178,13 +245,13 @@ async def get_account():
                 )
             
         except ImportError:
-            print("❌ MetaTrader5 module not installed!")
+            logger.error("MetaTrader5 module not installed!")
             raise HTTPException(
                 status_code=503,
                 detail="MetaTrader5 package not installed. Install with: pip install MetaTrader5"
             )
         except Exception as e:
-            print(f"❌ MT5 connection error: {e}")
+            logger.error("MT5 connection error: %s", e)
             raise HTTPException(
                 status_code=500,
                 detail=f"MT5 connection failed: {str(e)}"
@@ -198,10 +265,11 @@ async def get_account():
 async def get_positions():
     """Get open positions"""
     try:
-        positions = position_manager.get_all_positions()
+        positions = _position_manager().get_all_positions()
         
-        return [
-            PositionResponse(
+        # Values come from our own Position objects, so skip re-validation
+        items = [
+            PositionResponse.model_construct(
                 position_id=pos.position_id,
                 pair=pos.pair,
                 direction=pos.direction.value,
@@ -214,51 +282,47 @@ async def get_positions():
             )
             for pos in positions
         ]
+        return _json_response(_positions_adapter.dump_json(items, exclude_none=True))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def _stream_trades(limit: int):
+    """Yield trade history as a chunked JSON array"""
+    from backend.database import db
+    from backend.database.dal import TradeDAL
+    
+    async with db.get_async_session() as session:
+        yield b"["
+        separator = b""
+        async for trade in TradeDAL.stream_recent_trades(session, limit):
+            yield separator + _trade_encoder.encode(TradeStruct(**trade))
+            separator = b","
+        yield b"]"
+
+
 @router.get("/trades", response_model=List[TradeResponse])
 async def get_trades(limit: int = 100):
     """Get trade history"""
-    session = None
+    if limit > TRADES_STREAM_THRESHOLD:
+        # Bounded memory and early first byte for large histories
+        return StreamingResponse(_stream_trades(limit), media_type="application/json")
+    
     try:
         from backend.database import db
         from backend.database.dal import TradeDAL
         
-        session = db.get_session()
-        trade_dal = TradeDAL(session)
-        
-        trades = trade_dal.get_trade_history(limit=limit)
-        
-        result = [
-            TradeResponse(
-                trade_id=trade.trade_id,
-                pair=trade.pair,
-                direction=trade.direction,
-                size=trade.size,
-                entry_price=trade.entry_price,
-                exit_price=trade.exit_price,
-                pnl=trade.pnl,
-                opened_at=trade.opened_at.isoformat(),
-                closed_at=trade.closed_at.isoformat() if trade.closed_at else None,
-                status=trade.status
-            )
-            for trade in trades
-        ]
+        async with db.get_async_session() as session:
+            trades = await TradeDAL.get_recent_trades(session, limit=limit)
         
-        return result
+        # DB rows are trusted; msgspec structs skip validation and omit None fields
+        return _json_response(_trade_encoder.encode([TradeStruct(**trade) for trade in trades]))
         
     except ImportError as e:
         # Database not initialized, return empty list
-        print(f"⚠️ Database not available: {e}")
+        logger.warning("Database not available: %s", e)
         return []
     except Exception as e:
-        print(f"❌ Error getting trades: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error getting trades: %s", e)
         # Return empty list instead of error
         return []
-    finally:
-        if session:
-            session.close()
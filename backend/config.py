@@ -4,7 +4,9 @@ Loads settings from config.yaml and environment variables
 """
 
 import os
+import re
 import yaml
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, Any, List
 from pydantic_settings import BaseSettings
@@ -36,9 +38,28 @@ class TradingConfig(BaseSettings):
     enabled: bool = True
 
 
+# ${VAR} placeholders, substituted in the raw YAML before parsing
+_ENV_VAR_PATTERN = re.compile(rb'\$\{([A-Za-z_][A-Za-z0-9_]*)\}')
+
+# libyaml C loader when available
+_YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+def _substitute_env_var(match: re.Match) -> bytes:
+    """Replace a ${VAR} placeholder with its value, leaving unset ones as-is"""
+    value = os.environ.get(match.group(1).decode())
+    return match.group(0) if value is None else value.encode()
+
+
 class Config:
     """Main configuration class"""
     
+    # Section accessors memoized with cached_property, cleared on reload
+    _CACHED_SECTIONS = (
+        'trading', 'risk', 'ai_services', 'broker',
+        'database', 'logging_config', 'strategies'
+    )
+    
     def __init__(self, config_path: str = "config.yaml"):
         self.config_path = Path(config_path)
         self._config: Dict[str, Any] = {}
@@ -49,32 +70,25 @@ class Config:
         if not self.config_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
         
-        with open(self.config_path, 'r') as f:
-            self._config = yaml.safe_load(f)
+        # Replace environment variable placeholders in a single pass
+        text = _ENV_VAR_PATTERN.sub(_substitute_env_var, self.config_path.read_bytes())
+        self._config = yaml.load(text, Loader=_YamlLoader) or {}
         
-        # Replace environment variable placeholders
-        self._replace_env_vars(self._config)
-    
-    def _replace_env_vars(self, config: Dict[str, Any]):
-        """Recursively replace ${VAR} with environment variables"""
-        for key, value in config.items():
-            if isinstance(value, dict):
-                self._replace_env_vars(value)
-            elif isinstance(value, str) and value.startswith("${") and value.endswith("}"):
-                env_var = value[2:-1]
-                config[key] = os.getenv(env_var, value)
+        # Drop section models built from the previous load
+        for name in self._CACHED_SECTIONS:
+            vars(self).pop(name, None)
     
-    @property
+    @cached_property
     def trading(self) -> TradingConfig:
         """Get trading configuration"""
         return TradingConfig(**self._config.get('trading', {}))
     
-    @property
+    @cached_property
     def risk(self) -> RiskConfig:
         """Get risk configuration"""
         return RiskConfig(**self._config.get('risk', {}))
     
-    @property
+    @cached_property
     def ai_services(self) -> Dict[str, AIServiceConfig]:
         """Get AI service configurations"""
         ai_config = self._config.get('ai', {})
@@ -83,22 +97,22 @@ class Config:
             for name, config in ai_config.items()
         }
     
-    @property
+    @cached_property
     def broker(self) -> Dict[str, Any]:
         """Get broker configuration"""
         return self._config.get('broker', {})
     
-    @property
+    @cached_property
     def database(self) -> Dict[str, Any]:
         """Get database configuration"""
         return self._config.get('database', {})
     
-    @property
+    @cached_property
     def logging_config(self) -> Dict[str, Any]:
         """Get logging configuration"""
         return self._config.get('logging', {})
     
-    @property
+    @cached_property
     def strategies(self) -> Dict[str, Any]:
         """Get strategy configurations"""
         return self._config.get('strategies', {})
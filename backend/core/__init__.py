@@ -6,6 +6,8 @@ Core utilities and services
 from .config import settings, Settings, get_setting, validate_required_settings
 from .events import event_bus, EventBus, Event, EventType
 from .security import security_manager, SecurityManager
+from .cache import cached, single_flight, close_cache
+from .log_config import setup_logging, shutdown_logging
 
 __all__ = [
     'settings',
@@ -17,5 +19,10 @@ __all__ = [
     'Event',
     'EventType',
     'security_manager',
-    'SecurityManager'
+    'SecurityManager',
+    'cached',
+    'single_flight',
+    'close_cache',
+    'setup_logging',
+    'shutdown_logging'
 ]
@@ -0,0 +1,184 @@
+"""
+Response Cache for KeenAI-Quant Backend
+Redis-backed TTL cache for read-heavy API endpoints, plus an in-process
+single-flight layer for endpoints polled at high frequency
+
+The Redis server should run with `maxmemory-policy allkeys-lfu` so that
+frequently polled endpoints stay resident when memory is tight.
+"""
+
+import time
+import asyncio
+import logging
+import functools
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import orjson
+from fastapi import HTTPException, Response
+from fastapi.encoders import jsonable_encoder
+
+from .config import settings
+
+# Optional Redis client - endpoints are served uncached without it
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+    aioredis = None
+
+logger = logging.getLogger(__name__)
+
+CACHE_PREFIX = "keenai:cache:"
+STALE_TTL = 3600  # seconds a stale copy is kept for fallback
+RETRY_INTERVAL = 30  # seconds to wait before reconnecting after a failure
+
+_client: Optional[Any] = None
+_disabled_until = 0.0
+
+
+def _get_client():
+    """Get the shared Redis client, or None while Redis is unavailable"""
+    global _client
+
+    if not REDIS_AVAILABLE or time.monotonic() < _disabled_until:
+        return None
+
+    if _client is None:
+        _client = aioredis.from_url(settings.redis_url)
+    return _client
+
+
+def _mark_unavailable(error: Exception):
+    """Back off from Redis for a while after a connection error"""
+    global _disabled_until
+    _disabled_until = time.monotonic() + RETRY_INTERVAL
+    logger.warning("Response cache unavailable, serving uncached: %s", error)
+
+
+def _build_key(func: Callable, kwargs: dict) -> str:
+    """Build a cache key from the endpoint and its query parameters"""
+    query = "&".join(f"{k}={kwargs[k]}" for k in sorted(kwargs))
+    return f"{CACHE_PREFIX}{func.__module__}.{func.__name__}?{query}"
+
+
+def _to_response(body: bytes, status: int) -> Response:
+    """Wrap cached body bytes in a JSON response"""
+    return Response(content=body, status_code=status, media_type="application/json")
+
+
+def cached(ttl: int, stale_fallback: bool = True):
+    """
+    Cache an endpoint's JSON response in Redis
+
+    Args:
+        ttl: Time to live of a fresh entry in seconds
+        stale_fallback: Serve the last good response if the endpoint fails
+    """
+    def decorator(func: Callable):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            client = _get_client()
+            if client is None:
+                return await func(*args, **kwargs)
+
+            key = _build_key(func, kwargs)
+
+            try:
+                entry = await client.hgetall(key)
+                if entry:
+                    return _to_response(entry[b"body"], int(entry[b"status"]))
+            except Exception as e:
+                _mark_unavailable(e)
+                return await func(*args, **kwargs)
+
+            try:
+                result = await func(*args, **kwargs)
+            except Exception as e:
+                server_error = not isinstance(e, HTTPException) or e.status_code >= 500
+                if stale_fallback and server_error:
+                    try:
+                        stale = await client.hgetall(f"{key}:stale")
+                        if stale:
+                            return _to_response(stale[b"body"], int(stale[b"status"]))
+                    except Exception:
+                        pass
+                raise
+
+            if isinstance(result, Response):
+                # Pre-rendered responses are cached as-is; streams are passed through
+                body = getattr(result, "body", None)
+                if body is None:
+                    return result
+                status = result.status_code
+            else:
+                body = orjson.dumps(jsonable_encoder(result))
+                status = 200
+            entry = {"body": body, "status": status}
+
+            try:
+                async with client.pipeline(transaction=False) as pipe:
+                    pipe.hset(key, mapping=entry)
+                    pipe.expire(key, ttl)
+                    if stale_fallback:
+                        pipe.hset(f"{key}:stale", mapping=entry)
+                        pipe.expire(f"{key}:stale", STALE_TTL)
+                    await pipe.execute()
+            except Exception as e:
+                _mark_unavailable(e)
+
+            return _to_response(body, status)
+
+        return wrapper
+    return decorator
+
+
+def single_flight(ttl: float):
+    """
+    Share one endpoint call and its result across concurrent callers
+
+    The call runs in its own task and every caller, the first included,
+    awaits it through asyncio.shield, so a cancelled caller never cancels
+    the call for the others. The result is reused in-process for ttl
+    seconds; errors are not cached.
+
+    Args:
+        ttl: Time in seconds a completed result is reused
+    """
+    def decorator(func: Callable):
+        entries: Dict[str, Tuple[float, asyncio.Task]] = {}
+
+        def settle(key: str, task: asyncio.Task):
+            """Keep a successful result for ttl seconds, drop failures"""
+            if entries.get(key, (0.0, None))[1] is not task:
+                return
+            if task.cancelled() or task.exception() is not None:
+                entries.pop(key, None)
+            else:
+                entries[key] = (time.monotonic() + ttl, task)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = _build_key(func, kwargs)
+            entry = entries.get(key)
+            if entry is not None:
+                expires_at, task = entry
+                if not task.done() or time.monotonic() < expires_at:
+                    return await asyncio.shield(task)
+
+            # No await between the lookup and this insert, so no lock is needed
+            task = asyncio.create_task(func(*args, **kwargs))
+            entries[key] = (0.0, task)
+            task.add_done_callback(functools.partial(settle, key))
+            return await asyncio.shield(task)
+
+        return wrapper
+    return decorator
+
+
+async def close_cache():
+    """Close the shared Redis client"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -27,6 +27,9 @@ class Settings(BaseSettings):
     # Database
     database_url: str = Field(default="sqlite:///./data/keenai.db", env="DATABASE_URL")
     
+    # Cache
+    redis_url: str = Field(default="redis://localhost:6379/0", env="REDIS_URL")
+    
     # Application Settings
     environment: str = Field(default="development", env="ENVIRONMENT")
     debug: bool = Field(default=True, env="DEBUG")
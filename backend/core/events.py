@@ -3,10 +3,16 @@ Event System for KeenAI-Quant Backend
 Pub/Sub event handling for system-wide notifications
 """
 
-from typing import Callable, Dict, List, Any
+from typing import Callable, Deque, Dict, List, Any, Optional, Tuple
+from collections import deque
+from itertools import islice
 from datetime import datetime
 from enum import Enum
 import asyncio
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
 
 
 class EventType(Enum):
@@ -59,9 +65,13 @@ class EventBus:
     
     def __init__(self):
         """Initialize event bus"""
-        self._subscribers: Dict[EventType, List[Callable]] = {}
-        self._event_history: List[Event] = []
+        # Callbacks are stored as (is_coroutine, callback) so publish() never re-inspects them
+        self._subscribers: Dict[EventType, List[Tuple[bool, Callable]]] = {}
+        # Immutable per-type snapshots read by publish(), rebuilt on (un)subscribe
+        self._frozen: Dict[EventType, Tuple[Tuple[bool, Callable], ...]] = {}
+        self._lock = threading.Lock()
         self._max_history = 1000
+        self._event_history: Deque[Event] = deque(maxlen=self._max_history)
     
     def subscribe(self, event_type: EventType, callback: Callable):
         """
@@ -71,10 +81,14 @@ class EventBus:
             event_type: Type of event to subscribe to
             callback: Function to call when event occurs
         """
-        if event_type not in self._subscribers:
-            self._subscribers[event_type] = []
+        entry = (asyncio.iscoroutinefunction(callback), callback)
         
-        self._subscribers[event_type].append(callback)
+        with self._lock:
+            if event_type not in self._subscribers:
+                self._subscribers[event_type] = []
+            
+            self._subscribers[event_type].append(entry)
+            self._frozen[event_type] = tuple(self._subscribers[event_type])
     
     def unsubscribe(self, event_type: EventType, callback: Callable):
         """
@@ -84,8 +98,12 @@ class EventBus:
             event_type: Type of event to unsubscribe from
             callback: Callback function to remove
         """
-        if event_type in self._subscribers:
-            self._subscribers[event_type].remove(callback)
+        entry = (asyncio.iscoroutinefunction(callback), callback)
+        
+        with self._lock:
+            if event_type in self._subscribers:
+                self._subscribers[event_type].remove(entry)
+                self._frozen[event_type] = tuple(self._subscribers[event_type])
     
     async def publish(self, event_type: EventType, data: Dict[str, Any]):
         """
@@ -97,21 +115,34 @@ class EventBus:
         """
         event = Event(event_type, data)
         
-        # Store in history
+        # Store in history (oldest events drop off automatically)
         self._event_history.append(event)
-        if len(self._event_history) > self._max_history:
-            self._event_history.pop(0)
         
-        # Notify subscribers
-        if event_type in self._subscribers:
-            for callback in self._subscribers[event_type]:
-                try:
-                    if asyncio.iscoroutinefunction(callback):
-                        await callback(event)
-                    else:
-                        callback(event)
-                except Exception as e:
-                    print(f"Error in event callback: {e}")
+        # Snapshot is immutable, so callbacks may (un)subscribe while we notify
+        subscribers = self._frozen.get(event_type, ())
+        
+        if not subscribers:
+            return
+        
+        # Sync callbacks run inline, async callbacks run concurrently
+        coroutines = []
+        for is_coro, callback in subscribers:
+            if is_coro:
+                coroutines.append(callback(event))
+                continue
+            try:
+                callback(event)
+            except Exception:
+                logger.exception("Error in event callback for %s", event_type.value)
+        
+        if coroutines:
+            results = await asyncio.gather(*coroutines, return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(
+                        "Error in event callback for %s", event_type.value,
+                        exc_info=result
+                    )
     
     def get_history(self, event_type: Optional[EventType] = None, limit: int = 100) -> List[Event]:
         """
@@ -124,12 +155,22 @@ class EventBus:
         Returns:
             List of events
         """
-        events = self._event_history
+        if limit <= 0:
+            # Same slice semantics as before: 0 returns the full history
+            events = self._event_history
+            if event_type:
+                events = [e for e in events if e.type == event_type]
+            return list(events)[-limit:]
+        
+        # Walk newest-first so only the requested tail is visited
+        events = reversed(self._event_history)
         
         if event_type:
-            events = [e for e in events if e.type == event_type]
+            events = (e for e in events if e.type == event_type)
         
-        return events[-limit:]
+        recent = list(islice(events, limit))
+        recent.reverse()
+        return recent
 
 
 # Global event bus instance
@@ -0,0 +1,53 @@
+"""
+Logging Setup for KeenAI-Quant Backend
+Queue-based logging so handler I/O stays off the event loop thread
+"""
+
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+LOG_FORMAT = "%(asctime)s %(levelname)s [%(name)s] %(message)s"
+
+_listener: Optional[QueueListener] = None
+
+
+def setup_logging(level: int = logging.INFO):
+    """
+    Route all log records through a queue drained by a background thread
+    
+    Handlers already on the root logger are moved behind the queue; a stream
+    handler is used when none are configured.
+    
+    Args:
+        level: Root logger level
+    """
+    global _listener
+    
+    if _listener is not None:
+        return
+    
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    if not handlers:
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        handlers = [stream_handler]
+    
+    log_queue = queue.Queue(-1)
+    root.handlers = [QueueHandler(log_queue)]
+    root.setLevel(level)
+    
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+
+def shutdown_logging():
+    """Flush queued records and stop the listener thread"""
+    global _listener
+    
+    if _listener is not None:
+        _listener.stop()
+        logging.getLogger().handlers = list(_listener.handlers)
+        _listener = None
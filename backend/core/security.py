@@ -4,14 +4,40 @@ API key validation, encryption, and security helpers
 """
 
 import hashlib
+import hmac
 import secrets
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, List, Optional
 from cryptography.fernet import Fernet
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+import blake3
 import base64
 
 
+# Shared Argon2id hasher (holds the tuned cost parameters)
+_password_hasher = PasswordHasher()
+
+
+@lru_cache(maxsize=None)
+def _get_cipher(encryption_key: str) -> Fernet:
+    """Derive the Fernet cipher for a key once per process"""
+    # Ensure key is proper length for Fernet
+    key = hashlib.sha256(encryption_key.encode()).digest()
+    return Fernet(base64.urlsafe_b64encode(key))
+
+
 class SecurityManager:
-    """Manages security operations"""
+    """Manages security operations (one shared instance per encryption key)"""
+    
+    _instances: Dict[Optional[str], "SecurityManager"] = {}
+    
+    def __new__(cls, encryption_key: Optional[str] = None):
+        instance = cls._instances.get(encryption_key)
+        if instance is None:
+            instance = super().__new__(cls)
+            cls._instances[encryption_key] = instance
+        return instance
     
     def __init__(self, encryption_key: Optional[str] = None):
         """
@@ -20,12 +46,7 @@ class SecurityManager:
         Args:
             encryption_key: Encryption key for sensitive data
         """
-        if encryption_key:
-            # Ensure key is proper length for Fernet
-            key = hashlib.sha256(encryption_key.encode()).digest()
-            self.cipher = Fernet(base64.urlsafe_b64encode(key))
-        else:
-            self.cipher = None
+        self.cipher = _get_cipher(encryption_key) if encryption_key else None
     
     def encrypt(self, data: str) -> str:
         """
@@ -59,6 +80,38 @@ class SecurityManager:
         decrypted = self.cipher.decrypt(encrypted_data.encode())
         return decrypted.decode()
     
+    def encrypt_many(self, items: List[str]) -> List[str]:
+        """
+        Encrypt several values with the same cipher
+        
+        Args:
+            items: Data to encrypt
+            
+        Returns:
+            Encrypted data as strings, in input order
+        """
+        if not self.cipher:
+            return list(items)
+        
+        encrypt = self.cipher.encrypt
+        return [encrypt(item.encode()).decode() for item in items]
+    
+    def decrypt_many(self, items: List[str]) -> List[str]:
+        """
+        Decrypt several values with the same cipher
+        
+        Args:
+            items: Encrypted data
+            
+        Returns:
+            Decrypted data as strings, in input order
+        """
+        if not self.cipher:
+            return list(items)
+        
+        decrypt = self.cipher.decrypt
+        return [decrypt(item.encode()).decode() for item in items]
+    
     @staticmethod
     def generate_api_key() -> str:
         """
@@ -72,15 +125,15 @@ class SecurityManager:
     @staticmethod
     def hash_password(password: str) -> str:
         """
-        Hash a password
+        Hash a password with Argon2id
         
         Args:
             password: Plain text password
             
         Returns:
-            Hashed password
+            Hashed password (PHC string, includes salt and parameters)
         """
-        return hashlib.sha256(password.encode()).hexdigest()
+        return _password_hasher.hash(password)
     
     @staticmethod
     def verify_password(password: str, hashed: str) -> bool:
@@ -89,12 +142,33 @@ class SecurityManager:
         
         Args:
             password: Plain text password
-            hashed: Hashed password
+            hashed: Hashed password (Argon2 or legacy SHA-256 hex)
             
         Returns:
             True if password matches
         """
-        return hashlib.sha256(password.encode()).hexdigest() == hashed
+        if hashed.startswith("$argon2"):
+            try:
+                return _password_hasher.verify(hashed, password)
+            except (VerificationError, InvalidHashError):
+                return False
+        
+        # Legacy unsalted SHA-256 hashes
+        legacy = hashlib.sha256(password.encode()).hexdigest()
+        return hmac.compare_digest(legacy, hashed)
+    
+    @staticmethod
+    def fingerprint(data: str) -> str:
+        """
+        Fast BLAKE3 fingerprint for integrity checks and lookup ids
+        
+        Args:
+            data: Data to fingerprint
+            
+        Returns:
+            BLAKE3 hex digest
+        """
+        return blake3.blake3(data.encode()).hexdigest()
     
     @staticmethod
     def validate_api_key(api_key: str) -> bool:
@@ -11,7 +11,10 @@ from .dal import (
     SystemLogDAL,
     StrategyPerformanceDAL,
     RiskEventDAL,
-    BacktestDAL
+    BacktestDAL,
+    PerformanceDAL,
+    start_batch_writers,
+    stop_batch_writers
 )
 
 __all__ = [
@@ -24,5 +27,8 @@ __all__ = [
     'SystemLogDAL',
     'StrategyPerformanceDAL',
     'RiskEventDAL',
-    'BacktestDAL'
+    'BacktestDAL',
+    'PerformanceDAL',
+    'start_batch_writers',
+    'stop_batch_writers'
 ]
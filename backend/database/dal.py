@@ -1,123 +1,553 @@
 """
 Database Access Layer (DAL) for KeenAI-Quant
 Provides CRUD operations and common queries
+
+All methods are coroutines taking an AsyncSession (see db.get_async_session()),
+so database waits yield to the event loop instead of blocking it.
 """
 
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, and_, func
+import asyncio
+import logging
+from collections import deque
+import numpy as np
+import pandas as pd
+from cachetools import TTLCache
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from sqlalchemy import desc, and_, func, select, insert, bindparam, literal_column, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from .schema import (
-    HistoricalCandle, Trade, AIDecision, AgentPerformance,
-    SystemLog, StrategyPerformance, RiskEvent, BacktestResult
+    db, HistoricalCandle, Trade, AIDecision, AgentPerformance,
+    SystemLog, StrategyPerformance, RiskEvent, BacktestResult, EquitySnapshot,
+    to_epoch
 )
 from backend.models.trading_models import Candle, AgentPrediction
 
+logger = logging.getLogger(__name__)
+
+# Rows fetched per driver round trip for streamed (server-side cursor) reads
+FETCH_BATCH_SIZE = 1000
+
+# Rows sent per executemany batch for bulk inserts
+INSERT_BATCH_SIZE = 5000
+
+# Columns of the unique candle index (idx_pair_timeframe_timestamp)
+CANDLE_KEY = ['pair', 'timeframe', 'timestamp']
+
+# Candle reads repeat within a bar; cached rows are plain Row tuples, not ORM objects
+CANDLE_CACHE_TTL = 30
+_candle_cache: TTLCache = TTLCache(maxsize=256, ttl=CANDLE_CACHE_TTL)
+
+_CANDLE_COLUMNS = (
+    HistoricalCandle.pair,
+    HistoricalCandle.timeframe,
+    HistoricalCandle.timestamp,
+    HistoricalCandle.open,
+    HistoricalCandle.high,
+    HistoricalCandle.low,
+    HistoricalCandle.close,
+    HistoricalCandle.volume
+)
+
+# Column order for COPY-based ingest (PostgreSQL)
+_CANDLE_COPY_COLUMNS = [column.key for column in _CANDLE_COLUMNS]
+
+# Rolling time-window bounds are floored to this many seconds
+WINDOW_ROUNDING = 60
+
+# Recent AI decisions keyed by (agent_name, start_time); cleared on every new decision
+_decision_cache: TTLCache = TTLCache(maxsize=64, ttl=WINDOW_ROUNDING)
+
+
+def _floor(dt: datetime, seconds: int = WINDOW_ROUNDING) -> datetime:
+    """Round dt down to a multiple of seconds so a burst of queries binds the same value"""
+    epoch = int(dt.timestamp()) // seconds * seconds
+    return datetime.fromtimestamp(epoch)
+
+
+def _dialect_insert(session: AsyncSession, table):
+    """INSERT construct with ON CONFLICT support for the session's dialect, if any"""
+    dialect = session.get_bind().dialect.name
+    if dialect == 'sqlite':
+        return sqlite_insert(table)
+    if dialect == 'postgresql':
+        return pg_insert(table)
+    return None
+
+
+def _insert_ignore(session: AsyncSession, table, index_elements: List[str]):
+    """Build an INSERT that skips rows conflicting with a unique index"""
+    stmt = _dialect_insert(session, table)
+    if stmt is None:
+        return insert(table)
+    return stmt.on_conflict_do_nothing(index_elements=index_elements)
+
+
+async def _upsert(session: AsyncSession, model, key: Dict[str, Any], values: Dict[str, Any]):
+    """
+    Insert a row or update it in place when its unique key already exists
+    
+    SQLite and PostgreSQL do this in one INSERT ... ON CONFLICT statement;
+    other dialects fall back to SELECT, then UPDATE or INSERT.
+    
+    Args:
+        session: Database session
+        model: ORM model with a unique index over the key columns
+        key: Unique key columns and their values
+        values: Columns to set on insert and overwrite on conflict
+    """
+    stmt = _dialect_insert(session, model.__table__)
+    if stmt is None:
+        result = await session.execute(select(model).filter_by(**key))
+        row = result.scalars().first()
+        if row:
+            for column, value in values.items():
+                setattr(row, column, value)
+        else:
+            session.add(model(**key, **values))
+    else:
+        stmt = stmt.values(**key, **values)
+        if values:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=list(key),
+                set_={column: stmt.excluded[column] for column in values}
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=list(key))
+        await session.execute(stmt)
+    
+    await session.commit()
+
+
+class _BatchWriter:
+    """
+    Buffers fire-and-forget rows for one table and inserts them in batches
+    
+    put() never blocks and is safe from any thread; a background task flushes
+    the buffer every interval seconds. The task is started by
+    start_batch_writers(), or lazily by the first put() made on a running
+    event loop, so any async process drains its rows. With maxlen set the
+    buffer is a ring: when nothing is draining it the oldest rows are
+    dropped instead of growing without bound. Drops are counted in
+    `dropped` and reported by the flush loop.
+    """
+    
+    def __init__(
+        self,
+        model,
+        interval: float = 0.5,
+        max_batch: int = 1000,
+        maxlen: Optional[int] = None,
+        on_flush=None
+    ):
+        self.model = model
+        self.interval = interval
+        self.max_batch = max_batch
+        self.on_flush = on_flush
+        # deque append/popleft are atomic, so producers need no lock
+        self._buffer: deque = deque(maxlen=maxlen)
+        self._task: Optional[asyncio.Task] = None
+        self.dropped = 0
+        self._reported_dropped = 0
+    
+    def put(self, row: Dict[str, Any]):
+        """Queue a row for the next flush"""
+        if self._buffer.maxlen is not None and len(self._buffer) == self._buffer.maxlen:
+            # The append below evicts the oldest row
+            self.dropped += 1
+        self._buffer.append(row)
+        if self._task is None or self._task.done():
+            try:
+                self.start()
+            except RuntimeError:
+                # No running loop in this thread; the ring keeps the newest rows
+                pass
+    
+    async def flush(self) -> int:
+        """Insert up to max_batch queued rows in one executemany and commit"""
+        rows = []
+        while len(rows) < self.max_batch:
+            try:
+                rows.append(self._buffer.popleft())
+            except IndexError:
+                break
+        
+        if rows:
+            async with db.get_async_session() as session:
+                await session.execute(insert(self.model.__table__), rows)
+                await session.commit()
+            if self.on_flush:
+                self.on_flush()
+        return len(rows)
+    
+    def _report_dropped(self):
+        """Log rows evicted from the ring since the last report"""
+        dropped = self.dropped - self._reported_dropped
+        if dropped:
+            self._reported_dropped = self.dropped
+            logger.warning(
+                "Dropped %d queued %s rows (buffer full, %d dropped in total)",
+                dropped, self.model.__tablename__, self.dropped
+            )
+    
+    async def _run(self):
+        """Flush loop; drains full batches back to back"""
+        while True:
+            await asyncio.sleep(self.interval)
+            self._report_dropped()
+            try:
+                while await self.flush() == self.max_batch:
+                    pass
+            except Exception:
+                logger.exception("Error flushing %s", self.model.__tablename__)
+    
+    def start(self):
+        """Start the background flush task on the running loop"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+    
+    async def stop(self):
+        """Stop the flush task and write out everything still queued"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._report_dropped()
+        while await self.flush():
+            pass
+
 
 class CandleDAL:
     """Data access for historical candles"""
     
+    # Statements are built once with bind parameters; each call only binds values
+    _RECENT = select(*_CANDLE_COLUMNS).where(
+        and_(
+            HistoricalCandle.pair == bindparam('pair'),
+            HistoricalCandle.timeframe == bindparam('tf')
+        )
+    ).order_by(desc(HistoricalCandle.timestamp)).limit(bindparam('lim'))
+    
+    _RANGE = select(*_CANDLE_COLUMNS).where(
+        and_(
+            HistoricalCandle.pair == bindparam('pair'),
+            HistoricalCandle.timeframe == bindparam('tf'),
+            HistoricalCandle.timestamp >= bindparam('start'),
+            HistoricalCandle.timestamp <= bindparam('end')
+        )
+    ).order_by(HistoricalCandle.timestamp)
+    
+    _RANGE_OHLCV = select(
+        HistoricalCandle.timestamp,
+        HistoricalCandle.open,
+        HistoricalCandle.high,
+        HistoricalCandle.low,
+        HistoricalCandle.close,
+        HistoricalCandle.volume
+    ).where(
+        and_(
+            HistoricalCandle.pair == bindparam('pair'),
+            HistoricalCandle.timeframe == bindparam('tf'),
+            HistoricalCandle.timestamp >= bindparam('start'),
+            HistoricalCandle.timestamp <= bindparam('end')
+        )
+    ).order_by(HistoricalCandle.timestamp)
+    
     @staticmethod
-    def insert_candle(session: Session, candle: Candle) -> HistoricalCandle:
+    async def insert_candle(session: AsyncSession, candle: Candle):
         """Insert a single candle"""
-        db_candle = HistoricalCandle(
-            pair=candle.pair,
-            timeframe=candle.timeframe,
-            timestamp=candle.timestamp,
-            open=candle.open,
-            high=candle.high,
-            low=candle.low,
-            close=candle.close,
-            volume=candle.volume
+        await CandleDAL.insert_candles_bulk(session, [candle])
+    
+    @staticmethod
+    async def insert_candles_bulk(
+        session: AsyncSession,
+        candles: List[Candle],
+        batch_size: int = INSERT_BATCH_SIZE
+    ) -> int:
+        """
+        Insert candles with one executemany per batch and a single commit
+        
+        Candles already stored for the same (pair, timeframe, timestamp) are
+        skipped by the database instead of aborting the batch.
+        
+        Args:
+            session: Database session
+            candles: Candles to insert
+            batch_size: Rows per executemany batch
+            
+        Returns:
+            Number of candles submitted
+        """
+        if candles and session.get_bind().dialect.name == 'postgresql':
+            await CandleDAL._copy_candles(session, candles)
+        else:
+            stmt = _insert_ignore(session, HistoricalCandle.__table__, CANDLE_KEY)
+            for start in range(0, len(candles), batch_size):
+                await session.execute(stmt, [
+                    {
+                        "pair": c.pair,
+                        "timeframe": c.timeframe,
+                        "timestamp": to_epoch(c.timestamp),
+                        "open": c.open,
+                        "high": c.high,
+                        "low": c.low,
+                        "close": c.close,
+                        "volume": c.volume
+                    }
+                    for c in candles[start:start + batch_size]
+                ])
+        await session.commit()
+        
+        # Drop cached reads for every (pair, timeframe) that changed
+        touched = {(c.pair, c.timeframe) for c in candles}
+        for key in [k for k in _candle_cache if k[1:3] in touched]:
+            _candle_cache.pop(key, None)
+        
+        return len(candles)
+    
+    @staticmethod
+    async def _copy_candles(session: AsyncSession, candles: List[Candle]):
+        """
+        PostgreSQL ingest path: COPY into a staging table, then merge
+        
+        COPY itself cannot skip duplicates, so rows land in a transaction-scoped
+        temp table and are moved over with INSERT ... ON CONFLICT DO NOTHING.
+        """
+        await session.execute(text(
+            "CREATE TEMP TABLE _candle_stage "
+            "(LIKE historical_candles INCLUDING DEFAULTS) ON COMMIT DROP"
+        ))
+        
+        # asyncpg connection behind the session, inside the same transaction
+        connection = await session.connection()
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            '_candle_stage',
+            columns=_CANDLE_COPY_COLUMNS,
+            records=[
+                (c.pair, c.timeframe, to_epoch(c.timestamp),
+                 c.open, c.high, c.low, c.close, c.volume)
+                for c in candles
+            ]
         )
-        session.add(db_candle)
-        session.commit()
-        return db_candle
+        
+        columns = ', '.join(f'"{name}"' for name in _CANDLE_COPY_COLUMNS)
+        await session.execute(text(
+            f"INSERT INTO historical_candles ({columns}) "
+            f"SELECT {columns} FROM _candle_stage "
+            f"ON CONFLICT (pair, timeframe, \"timestamp\") DO NOTHING"
+        ))
     
     @staticmethod
-    def get_recent_candles(
-        session: Session,
+    async def get_recent_candles(
+        session: AsyncSession,
         pair: str,
         timeframe: str,
         limit: int = 1000
-    ) -> List[HistoricalCandle]:
-        """Get most recent candles for a pair/timeframe"""
-        return session.query(HistoricalCandle).filter(
-            and_(
-                HistoricalCandle.pair == pair,
-                HistoricalCandle.timeframe == timeframe
+    ) -> List[Row]:
+        """Get most recent candles for a pair/timeframe (cached for CANDLE_CACHE_TTL)"""
+        key = ('recent', pair, timeframe, limit)
+        rows = _candle_cache.get(key)
+        if rows is None:
+            result = await session.execute(
+                CandleDAL._RECENT,
+                {'pair': pair, 'tf': timeframe, 'lim': limit}
             )
-        ).order_by(desc(HistoricalCandle.timestamp)).limit(limit).all()
+            rows = _candle_cache[key] = result.all()
+        return rows
     
     @staticmethod
-    def get_candles_range(
-        session: Session,
+    async def get_candles_range(
+        session: AsyncSession,
         pair: str,
         timeframe: str,
         start_date: datetime,
         end_date: datetime
-    ) -> List[HistoricalCandle]:
-        """Get candles within a date range"""
-        return session.query(HistoricalCandle).filter(
-            and_(
-                HistoricalCandle.pair == pair,
-                HistoricalCandle.timeframe == timeframe,
-                HistoricalCandle.timestamp >= start_date,
-                HistoricalCandle.timestamp <= end_date
+    ) -> List[Row]:
+        """Get candles within a date range (cached for CANDLE_CACHE_TTL)"""
+        # Epoch-second bounds double as the cache key, so repeated backtest windows share it
+        start_ts = to_epoch(start_date)
+        end_ts = to_epoch(end_date)
+        key = ('range', pair, timeframe, start_ts, end_ts)
+        rows = _candle_cache.get(key)
+        if rows is None:
+            result = await session.execute(
+                CandleDAL._RANGE,
+                {'pair': pair, 'tf': timeframe, 'start': start_ts, 'end': end_ts}
+            )
+            rows = _candle_cache[key] = result.all()
+        return rows
+    
+    @staticmethod
+    async def iter_candles_range(
+        session: AsyncSession,
+        pair: str,
+        timeframe: str,
+        start_date: datetime,
+        end_date: datetime,
+        chunk: int = 10000
+    ) -> AsyncIterator[Row]:
+        """
+        Stream candles within a date range, holding at most chunk rows in memory
+        
+        Uncached alternative to get_candles_range for multi-year backtests.
+        Rows are fetched through a server-side cursor chunk rows at a time.
+        """
+        result = await session.stream(
+            CandleDAL._RANGE.execution_options(yield_per=chunk),
+            {
+                'pair': pair,
+                'tf': timeframe,
+                'start': to_epoch(start_date),
+                'end': to_epoch(end_date)
+            }
+        )
+        async for row in result:
+            yield row
+    
+    @staticmethod
+    async def get_candles_range_df(
+        session: AsyncSession,
+        pair: str,
+        timeframe: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> pd.DataFrame:
+        """
+        Get candles within a date range as a DataFrame indexed by timestamp
+        
+        OHLCV columns are loaded straight into float64 arrays, so indicator
+        code can work on whole columns without a Python object per candle.
+        """
+        params = {
+            'pair': pair,
+            'tf': timeframe,
+            'start': to_epoch(start_date),
+            'end': to_epoch(end_date)
+        }
+        
+        # pandas reads through a sync connection; run_sync keeps it on the async driver
+        return await session.run_sync(
+            lambda sync_session: pd.read_sql_query(
+                CandleDAL._RANGE_OHLCV,
+                sync_session.connection(),
+                params=params,
+                parse_dates={'timestamp': {'unit': 's'}},
+                index_col='timestamp'
             )
-        ).order_by(HistoricalCandle.timestamp).all()
+        )
 
 
 class TradeDAL:
     """Data access for trades"""
     
+    # Built once so repeated lookups reuse the compiled-statement cache entry
+    _BY_TRADE_ID = select(Trade).where(Trade.trade_id == bindparam('tid'))
+    # Status is rendered as a literal: the planner only matches the partial
+    # idx_trade_open index against a constant, not a bound parameter
+    _OPEN = select(Trade).where(Trade.status == literal_column("'OPEN'"))
+    _OPEN_BY_PAIR = _OPEN.where(Trade.pair == bindparam('pair'))
+    _OPENED_SINCE = select(Trade).where(Trade.opened_at >= bindparam('since'))
+    
+    # Most recent trades, selecting only the API columns
+    _RECENT = select(
+        Trade.trade_id,
+        Trade.pair,
+        Trade.direction,
+        Trade.size,
+        Trade.entry_price,
+        Trade.exit_price,
+        Trade.pnl,
+        Trade.opened_at,
+        Trade.closed_at,
+        Trade.status
+    ).order_by(desc(Trade.opened_at)).limit(bindparam('lim'))
+    
     @staticmethod
-    def insert_trade(session: Session, trade_data: Dict[str, Any]) -> Trade:
+    async def insert_trade(session: AsyncSession, trade_data: Dict[str, Any]) -> Trade:
         """Insert a new trade"""
         trade = Trade(**trade_data)
         session.add(trade)
-        session.commit()
+        await session.commit()
         return trade
     
     @staticmethod
-    def update_trade(session: Session, trade_id: str, updates: Dict[str, Any]) -> Optional[Trade]:
+    async def update_trade(session: AsyncSession, trade_id: str, updates: Dict[str, Any]) -> Optional[Trade]:
         """Update an existing trade"""
-        trade = session.query(Trade).filter(Trade.trade_id == trade_id).first()
+        result = await session.execute(TradeDAL._BY_TRADE_ID, {'tid': trade_id})
+        trade = result.scalar_one_or_none()
         if trade:
             for key, value in updates.items():
                 setattr(trade, key, value)
-            session.commit()
+            await session.commit()
         return trade
     
     @staticmethod
-    def get_open_trades(session: Session, pair: Optional[str] = None) -> List[Trade]:
+    async def get_open_trades(session: AsyncSession, pair: Optional[str] = None) -> List[Trade]:
         """Get all open trades, optionally filtered by pair"""
-        query = session.query(Trade).filter(Trade.status == 'OPEN')
         if pair:
-            query = query.filter(Trade.pair == pair)
-        return query.all()
+            result = await session.execute(TradeDAL._OPEN_BY_PAIR, {'pair': pair})
+        else:
+            result = await session.execute(TradeDAL._OPEN)
+        return result.scalars().all()
     
     @staticmethod
-    def get_trades_today(session: Session) -> List[Trade]:
+    async def get_trades_today(session: AsyncSession) -> List[Trade]:
         """Get all trades from today"""
         today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        return session.query(Trade).filter(
-            Trade.opened_at >= today_start
-        ).all()
+        result = await session.execute(TradeDAL._OPENED_SINCE, {'since': today_start})
+        return result.scalars().all()
     
     @staticmethod
-    def get_trade_history(
-        session: Session,
+    async def get_trade_history(
+        session: AsyncSession,
         pair: Optional[str] = None,
         days: int = 30
     ) -> List[Trade]:
-        """Get trade history for specified days"""
-        start_date = datetime.now() - timedelta(days=days)
-        query = session.query(Trade).filter(Trade.opened_at >= start_date)
+        """
+        Get trade history for specified days
+        
+        Each trade's ai_decisions are loaded up front in one batched query,
+        so reading them per trade does not issue a query per row.
+        """
+        start_date = _floor(datetime.now() - timedelta(days=days))
+        query = (
+            select(Trade)
+            .options(selectinload(Trade.ai_decisions))
+            .where(Trade.opened_at >= start_date)
+        )
         if pair:
-            query = query.filter(Trade.pair == pair)
-        return query.order_by(desc(Trade.opened_at)).all()
+            query = query.where(Trade.pair == pair)
+        result = await session.execute(query.order_by(desc(Trade.opened_at)))
+        return result.scalars().all()
+    
+    @staticmethod
+    async def get_recent_trades(session: AsyncSession, limit: int = 100) -> List[Dict[str, Any]]:
+        """Get most recent trades as plain dicts (no ORM hydration)"""
+        result = await session.execute(TradeDAL._RECENT, {'lim': limit})
+        return [dict(row) for row in result.mappings()]
+    
+    @staticmethod
+    async def stream_recent_trades(
+        session: AsyncSession,
+        limit: int,
+        batch_size: int = 500
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream most recent trades as dicts, fetching batch_size rows at a time"""
+        result = await session.stream(
+            TradeDAL._RECENT.execution_options(yield_per=batch_size),
+            {'lim': limit}
+        )
+        async for row in result.mappings():
+            yield dict(row)
 
 
 class AIDecisionDAL:
@@ -125,15 +555,14 @@ class AIDecisionDAL:
     
     @staticmethod
     def log_decision(
-        session: Session,
         pair: str,
         agent_name: str,
         prediction: AgentPrediction,
         ensemble_decision: Optional[str] = None,
         ensemble_confidence: Optional[float] = None
-    ) -> AIDecision:
-        """Log an AI agent decision"""
-        decision = AIDecision(
+    ):
+        """Queue an AI agent decision for the next batched write (non-blocking)"""
+        _decision_writer.put(dict(
             timestamp=prediction.timestamp,
             pair=pair,
             agent_name=agent_name,
@@ -142,72 +571,65 @@ class AIDecisionDAL:
             reasoning=prediction.reasoning,
             ensemble_decision=ensemble_decision,
             ensemble_confidence=ensemble_confidence
-        )
-        session.add(decision)
-        session.commit()
-        return decision
+        ))
     
     @staticmethod
-    def get_recent_decisions(
-        session: Session,
+    async def get_recent_decisions(
+        session: AsyncSession,
         agent_name: Optional[str] = None,
         hours: int = 24
     ) -> List[AIDecision]:
         """Get recent AI decisions"""
-        start_time = datetime.now() - timedelta(hours=hours)
-        query = session.query(AIDecision).filter(AIDecision.timestamp >= start_time)
-        if agent_name:
-            query = query.filter(AIDecision.agent_name == agent_name)
-        return query.order_by(desc(AIDecision.timestamp)).all()
+        start_time = _floor(datetime.now() - timedelta(hours=hours))
+        key = (agent_name, start_time)
+        decisions = _decision_cache.get(key)
+        if decisions is None:
+            query = select(AIDecision).where(AIDecision.timestamp >= start_time)
+            if agent_name:
+                query = query.where(AIDecision.agent_name == agent_name)
+            result = await session.execute(query.order_by(desc(AIDecision.timestamp)))
+            decisions = _decision_cache[key] = result.scalars().all()
+        return decisions
 
 
 class AgentPerformanceDAL:
     """Data access for agent performance metrics"""
     
+    _HISTORY = select(AgentPerformance).where(
+        and_(
+            AgentPerformance.agent_name == bindparam('agent'),
+            AgentPerformance.date >= bindparam('since')
+        )
+    ).order_by(AgentPerformance.date)
+    
     @staticmethod
-    def update_performance(
-        session: Session,
+    async def update_performance(
+        session: AsyncSession,
         agent_name: str,
         metrics: Dict[str, Any]
-    ) -> AgentPerformance:
-        """Update or create agent performance record"""
+    ):
+        """Update or create today's agent performance record in one statement"""
         today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        
-        perf = session.query(AgentPerformance).filter(
-            and_(
-                AgentPerformance.agent_name == agent_name,
-                AgentPerformance.date == today
-            )
-        ).first()
-        
-        if perf:
-            for key, value in metrics.items():
-                setattr(perf, key, value)
-        else:
-            perf = AgentPerformance(
-                agent_name=agent_name,
-                date=today,
-                **metrics
-            )
-            session.add(perf)
-        
-        session.commit()
-        return perf
+        await _upsert(
+            session,
+            AgentPerformance,
+            {'agent_name': agent_name, 'date': today},
+            metrics
+        )
     
     @staticmethod
-    def get_agent_performance(
-        session: Session,
+    async def get_agent_performance(
+        session: AsyncSession,
         agent_name: str,
         days: int = 30
     ) -> List[AgentPerformance]:
         """Get agent performance history"""
-        start_date = datetime.now() - timedelta(days=days)
-        return session.query(AgentPerformance).filter(
-            and_(
-                AgentPerformance.agent_name == agent_name,
-                AgentPerformance.date >= start_date
-            )
-        ).order_by(AgentPerformance.date).all()
+        start_date = _floor(datetime.now() - timedelta(days=days))
+        result = await session.execute(
+            AgentPerformanceDAL._HISTORY,
+            {'agent': agent_name, 'since': start_date}
+        )
+        return result.scalars().all()
 
 
 class SystemLogDAL:
@@ -215,139 +637,121 @@ class SystemLogDAL:
     
     @staticmethod
     def log(
-        session: Session,
         level: str,
         category: str,
         message: str,
         details: Optional[Dict] = None
-    ) -> SystemLog:
-        """Create a system log entry"""
-        log = SystemLog(
+    ):
+        """Queue a system log entry for the next batched write (non-blocking)"""
+        _log_writer.put(dict(
             timestamp=datetime.now(),
             level=level,
             category=category,
             message=message,
             details=details
-        )
-        session.add(log)
-        session.commit()
-        return log
+        ))
     
     @staticmethod
-    def get_logs(
-        session: Session,
+    async def get_logs(
+        session: AsyncSession,
         level: Optional[str] = None,
         category: Optional[str] = None,
         hours: int = 24,
         limit: int = 1000
-    ) -> List[SystemLog]:
-        """Get system logs with filters"""
-        start_time = datetime.now() - timedelta(hours=hours)
-        query = session.query(SystemLog).filter(SystemLog.timestamp >= start_time)
+    ) -> List[Dict[str, Any]]:
+        """Get system logs with filters as plain dicts (no ORM hydration)"""
+        start_time = _floor(datetime.now() - timedelta(hours=hours))
+        query = select(*SystemLog.__table__.columns).where(SystemLog.timestamp >= start_time)
         
         if level:
-            query = query.filter(SystemLog.level == level)
+            query = query.where(SystemLog.level == level)
         if category:
-            query = query.filter(SystemLog.category == category)
+            query = query.where(SystemLog.category == category)
         
-        return query.order_by(desc(SystemLog.timestamp)).limit(limit).all()
+        result = await session.execute(query.order_by(desc(SystemLog.timestamp)).limit(limit))
+        return [dict(row) for row in result.mappings()]
 
 
 class StrategyPerformanceDAL:
     """Data access for strategy performance"""
     
     @staticmethod
-    def update_performance(
-        session: Session,
+    async def update_performance(
+        session: AsyncSession,
         strategy_name: str,
         pair: str,
         metrics: Dict[str, Any]
-    ) -> StrategyPerformance:
-        """Update or create strategy performance record"""
+    ):
+        """Update or create today's strategy performance record in one statement"""
         today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        
-        perf = session.query(StrategyPerformance).filter(
-            and_(
-                StrategyPerformance.strategy_name == strategy_name,
-                StrategyPerformance.pair == pair,
-                StrategyPerformance.date == today
-            )
-        ).first()
-        
-        if perf:
-            for key, value in metrics.items():
-                setattr(perf, key, value)
-        else:
-            perf = StrategyPerformance(
-                strategy_name=strategy_name,
-                pair=pair,
-                date=today,
-                **metrics
-            )
-            session.add(perf)
-        
-        session.commit()
-        return perf
+        await _upsert(
+            session,
+            StrategyPerformance,
+            {'strategy_name': strategy_name, 'pair': pair, 'date': today},
+            metrics
+        )
     
     @staticmethod
-    def get_strategy_performance(
-        session: Session,
+    async def get_strategy_performance(
+        session: AsyncSession,
         strategy_name: str,
         pair: Optional[str] = None,
         days: int = 30
     ) -> List[StrategyPerformance]:
         """Get strategy performance history"""
-        start_date = datetime.now() - timedelta(days=days)
-        query = session.query(StrategyPerformance).filter(
+        start_date = _floor(datetime.now() - timedelta(days=days))
+        query = select(StrategyPerformance).where(
             and_(
                 StrategyPerformance.strategy_name == strategy_name,
                 StrategyPerformance.date >= start_date
             )
         )
         if pair:
-            query = query.filter(StrategyPerformance.pair == pair)
+            query = query.where(StrategyPerformance.pair == pair)
         
-        return query.order_by(StrategyPerformance.date).all()
+        result = await session.execute(query.order_by(StrategyPerformance.date))
+        return result.scalars().all()
 
 
 class RiskEventDAL:
     """Data access for risk events"""
     
+    _UNRESOLVED = select(RiskEvent).where(
+        RiskEvent.resolved == False
+    ).order_by(desc(RiskEvent.timestamp))
+    
     @staticmethod
     def log_event(
-        session: Session,
         event_type: str,
         description: str,
         pair: Optional[str] = None,
         details: Optional[Dict] = None
-    ) -> RiskEvent:
-        """Log a risk management event"""
-        event = RiskEvent(
+    ):
+        """Queue a risk management event for the next batched write (non-blocking)"""
+        _risk_event_writer.put(dict(
             timestamp=datetime.now(),
             event_type=event_type,
             pair=pair,
             description=description,
-            details=details
-        )
-        session.add(event)
-        session.commit()
-        return event
+            details=details,
+            resolved=False
+        ))
     
     @staticmethod
-    def get_unresolved_events(session: Session) -> List[RiskEvent]:
+    async def get_unresolved_events(session: AsyncSession) -> List[RiskEvent]:
         """Get all unresolved risk events"""
-        return session.query(RiskEvent).filter(
-            RiskEvent.resolved == False
-        ).order_by(desc(RiskEvent.timestamp)).all()
+        result = await session.execute(RiskEventDAL._UNRESOLVED)
+        return result.scalars().all()
     
     @staticmethod
-    def resolve_event(session: Session, event_id: int) -> Optional[RiskEvent]:
+    async def resolve_event(session: AsyncSession, event_id: int) -> Optional[RiskEvent]:
         """Mark a risk event as resolved"""
-        event = session.query(RiskEvent).filter(RiskEvent.id == event_id).first()
+        # Primary-key lookup; served from the identity map when already loaded
+        event = await session.get(RiskEvent, event_id)
         if event:
             event.resolved = True
             event.resolved_at = datetime.now()
-            session.commit()
+            await session.commit()
         return event
 
 
@@ -355,22 +759,112 @@ class BacktestDAL:
     """Data access for backtest results"""
     
     @staticmethod
-    def save_result(session: Session, result_data: Dict[str, Any]) -> BacktestResult:
+    async def save_result(session: AsyncSession, result_data: Dict[str, Any]) -> BacktestResult:
         """Save backtest result"""
         result = BacktestResult(**result_data)
         session.add(result)
-        session.commit()
+        await session.commit()
         return result
     
     @staticmethod
-    def get_results(
-        session: Session,
+    async def get_results(
+        session: AsyncSession,
         strategy_name: Optional[str] = None,
         limit: int = 50
-    ) -> List[BacktestResult]:
-        """Get backtest results"""
-        query = session.query(BacktestResult)
+    ) -> List[Dict[str, Any]]:
+        """Get backtest results as plain dicts (no ORM hydration)"""
+        query = select(*BacktestResult.__table__.columns)
         if strategy_name:
-            query = query.filter(BacktestResult.strategy_name == strategy_name)
+            query = query.where(BacktestResult.strategy_name == strategy_name)
         
-        return query.order_by(desc(BacktestResult.created_at)).limit(limit).all()
+        result = await session.execute(
+            query.order_by(desc(BacktestResult.created_at)).limit(limit)
+        )
+        return [dict(row) for row in result.mappings()]
+
+
+class PerformanceDAL:
+    """Data access for account equity snapshots"""
+    
+    # Columnar row layout used when streaming the equity curve into NumPy
+    _EQUITY_DTYPE = np.dtype([
+        ('timestamp', 'datetime64[ns]'),
+        ('equity', np.float64),
+        ('balance', np.float64)
+    ])
+    
+    _EQUITY_SINCE = (
+        select(
+            EquitySnapshot.timestamp,
+            EquitySnapshot.equity,
+            EquitySnapshot.balance
+        )
+        .where(EquitySnapshot.timestamp >= bindparam('since'))
+        .order_by(EquitySnapshot.timestamp)
+        .execution_options(yield_per=FETCH_BATCH_SIZE)
+    )
+    
+    @staticmethod
+    async def record_snapshot(
+        session: AsyncSession,
+        balance: float,
+        equity: float,
+        margin_used: float = 0.0,
+        unrealized_pnl: float = 0.0
+    ) -> EquitySnapshot:
+        """Record an account equity snapshot"""
+        snapshot = EquitySnapshot(
+            timestamp=datetime.now(),
+            balance=balance,
+            equity=equity,
+            margin_used=margin_used,
+            unrealized_pnl=unrealized_pnl
+        )
+        session.add(snapshot)
+        await session.commit()
+        return snapshot
+    
+    @staticmethod
+    async def get_equity_curve(
+        session: AsyncSession,
+        start_date: datetime
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get equity curve since start_date as columnar arrays
+        
+        Returns:
+            (timestamps as int64 ns, equity as float64, balance as float64)
+        """
+        result = await session.stream(PerformanceDAL._EQUITY_SINCE, {'since': start_date})
+        # One fromiter per fetched batch, then a single concatenate
+        chunks = [
+            np.fromiter((tuple(row) for row in partition), dtype=PerformanceDAL._EQUITY_DTYPE)
+            async for partition in result.partitions()
+        ]
+        rows = np.concatenate(chunks) if chunks else np.empty(0, dtype=PerformanceDAL._EQUITY_DTYPE)
+        return (
+            rows['timestamp'].view(np.int64),
+            rows['equity'],
+            rows['balance']
+        )
+
+
+# Background writers for append-only logging tables
+# AI decisions and risk events are the audit trail: low volume and never dropped
+_decision_writer = _BatchWriter(AIDecision, on_flush=_decision_cache.clear)
+_risk_event_writer = _BatchWriter(RiskEvent)
+# Observability only: flushed every second, oldest entries dropped past 50k
+_log_writer = _BatchWriter(SystemLog, interval=1.0, max_batch=5000, maxlen=50_000)
+_BATCH_WRITERS = (_decision_writer, _log_writer, _risk_event_writer)
+
+
+def start_batch_writers():
+    """Start background flushing of queued decisions, logs and risk events"""
+    for writer in _BATCH_WRITERS:
+        writer.start()
+
+
+async def stop_batch_writers():
+    """Stop background flushing and write out anything still queued"""
+    for writer in _BATCH_WRITERS:
+        await writer.stop()
@@ -23,7 +23,7 @@ def init_database():
     db_path.parent.mkdir(parents=True, exist_ok=True)
     
     # Initialize database
-    db.init_db()
+    db.init_db(verbose=True)
     
     print("\n✅ Database initialization complete!")
     print("\n📊 Available tables:")
@@ -35,6 +35,7 @@ def init_database():
     print("  - strategy_performance: Strategy metrics")
     print("  - risk_events: Risk management events")
     print("  - backtest_results: Backtest execution results")
+    print("  - equity_snapshots: Account equity curve")
     
     return True
 
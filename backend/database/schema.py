@@ -4,16 +4,45 @@ Following OpenAlgo's database patterns
 """
 
 from sqlalchemy import (
-    Column, Integer, String, Float, DateTime, Boolean, Text, JSON,
-    ForeignKey, Index, create_engine
+    Column, Integer, BigInteger, String, Float, DateTime, Boolean, Text, JSON,
+    LargeBinary, ForeignKey, Index, TypeDecorator, create_engine, event, inspect, text
 )
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, sessionmaker
-from datetime import datetime
+from sqlalchemy.pool import NullPool
+from datetime import datetime, timezone
+import orjson
 
 Base = declarative_base()
 
 
+class BinaryJSON(TypeDecorator):
+    """JSON payload stored as orjson-encoded bytes in a BLOB column"""
+    impl = LargeBinary
+    cache_ok = True
+    
+    def process_bind_param(self, value, dialect):
+        return None if value is None else orjson.dumps(value)
+    
+    def process_result_value(self, value, dialect):
+        # orjson.loads also accepts the str values of rows written as JSON text
+        return None if value is None else orjson.loads(value)
+
+
+def to_epoch(dt: datetime) -> int:
+    """Datetime to integer epoch seconds; naive datetimes are taken as UTC"""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+
+def from_epoch(ts: int) -> datetime:
+    """Integer epoch seconds to a naive UTC datetime (inverse of to_epoch)"""
+    return datetime.fromtimestamp(ts, timezone.utc).replace(tzinfo=None)
+
+
 class HistoricalCandle(Base):
     """Historical OHLCV candle data"""
     __tablename__ = 'historical_candles'
@@ -21,7 +50,7 @@ class HistoricalCandle(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     pair = Column(String(20), nullable=False, index=True)
     timeframe = Column(String(5), nullable=False, index=True)
-    timestamp = Column(DateTime, nullable=False, index=True)
+    timestamp = Column(BigInteger, nullable=False, index=True)  # Epoch seconds (UTC)
     open = Column(Float, nullable=False)
     high = Column(Float, nullable=False)
     low = Column(Float, nullable=False)
@@ -32,8 +61,28 @@ class HistoricalCandle(Base):
         Index('idx_pair_timeframe_timestamp', 'pair', 'timeframe', 'timestamp', unique=True),
     )
     
+    @property
+    def timestamp_dt(self) -> datetime:
+        """Candle open time as a naive UTC datetime"""
+        return from_epoch(self.timestamp)
+    
     def __repr__(self):
-        return f"<Candle {self.pair} {self.timeframe} {self.timestamp}>"
+        return f"<Candle {self.pair} {self.timeframe} {self.timestamp_dt}>"
+
+
+# Covering index for "latest N candles" reads: newest-first and including OHLCV,
+# so the query is answered from the index without touching the table rows
+Index(
+    'idx_candle_covering',
+    HistoricalCandle.pair,
+    HistoricalCandle.timeframe,
+    HistoricalCandle.timestamp.desc(),
+    HistoricalCandle.open,
+    HistoricalCandle.high,
+    HistoricalCandle.low,
+    HistoricalCandle.close,
+    HistoricalCandle.volume
+)
 
 
 class Trade(Base):
@@ -55,8 +104,26 @@ class Trade(Base):
     reason = Column(Text)  # Why the trade was taken
     status = Column(String(20), nullable=False)  # OPEN, CLOSED, CANCELLED
     
+    # Agent decisions on the same pair while the trade was open (read-only)
+    ai_decisions = relationship(
+        "AIDecision",
+        primaryjoin=(
+            "and_(foreign(AIDecision.pair) == Trade.pair, "
+            "AIDecision.timestamp >= Trade.opened_at, "
+            "or_(Trade.closed_at.is_(None), AIDecision.timestamp <= Trade.closed_at))"
+        ),
+        order_by="AIDecision.timestamp",
+        viewonly=True
+    )
+    
     __table_args__ = (
         Index('idx_pair_opened', 'pair', 'opened_at'),
+        # Partial index over open trades only, so it stays small as closed history grows
+        Index(
+            'idx_trade_open', 'pair', 'opened_at',
+            sqlite_where=text("status = 'OPEN'"),
+            postgresql_where=text("status = 'OPEN'")
+        ),
     )
     
     def __repr__(self):
@@ -117,7 +184,7 @@ class SystemLog(Base):
     level = Column(String(10), nullable=False, index=True)  # DEBUG, INFO, WARNING, ERROR
     category = Column(String(50), nullable=False, index=True)  # TRADE, AI, RISK, SYSTEM
     message = Column(Text, nullable=False)
-    details = Column(JSON)  # Additional structured data
+    details = Column(BinaryJSON)  # Additional structured data
     
     __table_args__ = (
         Index('idx_timestamp_level', 'timestamp', 'level'),
@@ -164,7 +231,7 @@ class RiskEvent(Base):
     event_type = Column(String(50), nullable=False, index=True)  # CIRCUIT_BREAKER, POSITION_REJECTED, etc.
     pair = Column(String(20))
     description = Column(Text, nullable=False)
-    details = Column(JSON)
+    details = Column(BinaryJSON)
     resolved = Column(Boolean, default=False)
     resolved_at = Column(DateTime)
     
@@ -208,46 +275,187 @@ class BacktestResult(Base):
         return f"<BacktestResult {self.backtest_id} {self.strategy_name}>"
 
 
+class EquitySnapshot(Base):
+    """Account equity/balance snapshots for the equity curve"""
+    __tablename__ = 'equity_snapshots'
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    timestamp = Column(DateTime, nullable=False, index=True)
+    balance = Column(Float, nullable=False)
+    equity = Column(Float, nullable=False)
+    margin_used = Column(Float, default=0.0)
+    unrealized_pnl = Column(Float, default=0.0)
+    
+    def __repr__(self):
+        return f"<EquitySnapshot {self.timestamp} {self.equity}>"
+
+
+def _apply_fetch_size(conn, cursor, statement, parameters, context, executemany):
+    """Match the driver's prefetch size to a statement's yield_per batch"""
+    fetch_size = context.execution_options.get('yield_per') if context else None
+    if fetch_size:
+        # DB-API fetchmany() default (SQLite) and named-cursor prefetch (psycopg2)
+        cursor.arraysize = fetch_size
+        if hasattr(cursor, 'itersize'):
+            cursor.itersize = fetch_size
+
+
+# WAL lets readers run alongside the ingest writer; NORMAL sync is durable under WAL
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MB
+    "PRAGMA cache_size=-65536",  # 64 MB
+)
+
+
+def _set_sqlite_pragmas(dbapi_conn, connection_record):
+    """Apply SQLITE_PRAGMAS to each new SQLite connection"""
+    cursor = dbapi_conn.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+# Async drivers used for the request path
+ASYNC_DRIVERS = {
+    'sqlite': 'sqlite+aiosqlite',
+    'postgresql': 'postgresql+asyncpg',
+}
+
+
 # Database connection and session management
 class Database:
     """Database manager"""
     
     def __init__(self, db_url: str = "sqlite:///./data/keenai.db"):
+        url = make_url(db_url)
+        is_sqlite = url.get_backend_name() == 'sqlite'
+        
+        # SQLite has a single writer, so a pool of sync connections buys nothing
+        pool_options = {'poolclass': NullPool} if is_sqlite else {
+            'pool_size': 10,
+            'max_overflow': 20
+        }
         self.engine = create_engine(
             db_url,
             echo=False,  # Set to True for SQL debugging
-            pool_size=10,
-            max_overflow=20,
-            pool_pre_ping=True  # Verify connections before using
+            pool_pre_ping=True,  # Verify connections before using
+            **pool_options
         )
+        event.listen(self.engine, "before_cursor_execute", _apply_fetch_size)
         self.SessionLocal = sessionmaker(
             autocommit=False,
             autoflush=False,
             bind=self.engine
         )
+        
+        # Async engine used by the DAL so DB waits don't block the event loop;
+        # the sync engine above only backs schema management (init_db.py)
+        self.async_engine = create_async_engine(
+            url.set(drivername=ASYNC_DRIVERS.get(url.get_backend_name(), url.drivername)),
+            echo=False,
+            pool_pre_ping=True
+        )
+        event.listen(self.async_engine.sync_engine, "before_cursor_execute", _apply_fetch_size)
+        
+        if is_sqlite:
+            event.listen(self.engine, "connect", _set_sqlite_pragmas)
+            event.listen(self.async_engine.sync_engine, "connect", _set_sqlite_pragmas)
+        
+        self.AsyncSessionLocal = async_sessionmaker(
+            self.async_engine,
+            expire_on_commit=False
+        )
     
     def create_tables(self):
         """Create all tables"""
         Base.metadata.create_all(bind=self.engine)
     
+    def create_missing_indexes(self):
+        """Create indexes added to the models after their tables already existed"""
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=self.engine, checkfirst=True)
+    
     def drop_tables(self):
         """Drop all tables (use with caution!)"""
         Base.metadata.drop_all(bind=self.engine)
     
     def get_session(self):
-        """Get database session"""
+        """Get synchronous database session (schema management / CLI only)"""
         return self.SessionLocal()
     
-    def init_db(self):
-        """Initialize database with tables and indexes"""
+    def get_async_session(self):
+        """Get async database session (use with `async with`)"""
+        return self.AsyncSessionLocal()
+    
+    def migrate_candle_timestamps(self):
+        """Convert historical_candles.timestamp from DATETIME values to epoch seconds"""
+        with self.engine.begin() as conn:
+            if conn.dialect.name == 'sqlite':
+                # SQLite stores DATETIME as ISO text; strftime('%s') reads it as UTC
+                result = conn.execute(text(
+                    "UPDATE historical_candles "
+                    "SET timestamp = CAST(strftime('%s', timestamp) AS INTEGER) "
+                    "WHERE typeof(timestamp) = 'text'"
+                ))
+                if result.rowcount:
+                    print(f"🔄 Converted {result.rowcount} candle timestamps to epoch seconds")
+            elif conn.dialect.name == 'postgresql':
+                columns = {c['name']: c for c in inspect(conn).get_columns('historical_candles')}
+                if not isinstance(columns['timestamp']['type'], Integer):
+                    conn.execute(text(
+                        'ALTER TABLE historical_candles ALTER COLUMN "timestamp" TYPE BIGINT '
+                        'USING EXTRACT(EPOCH FROM "timestamp")::BIGINT'
+                    ))
+                    print("🔄 Converted candle timestamps to epoch seconds")
+    
+    def migrate_details_columns(self):
+        """Convert JSON details columns of system_logs / risk_events to BLOB"""
+        with self.engine.begin() as conn:
+            # SQLite keeps existing JSON text rows readable as-is; only PostgreSQL
+            # needs its json columns retyped
+            if conn.dialect.name != 'postgresql':
+                return
+            for table in ('system_logs', 'risk_events'):
+                columns = {c['name']: c for c in inspect(conn).get_columns(table)}
+                if not isinstance(columns['details']['type'], LargeBinary):
+                    conn.execute(text(
+                        f"ALTER TABLE {table} ALTER COLUMN details TYPE BYTEA "
+                        f"USING convert_to(details::text, 'UTF8')"
+                    ))
+                    print(f"🔄 Converted {table}.details to binary JSON")
+    
+    def analyze(self):
+        """Refresh planner statistics so index choices are accurate"""
+        with self.engine.begin() as conn:
+            conn.exec_driver_sql("ANALYZE")
+    
+    def vacuum(self):
+        """Reclaim space after bulk deletes (e.g. nightly, after pruning old logs)"""
+        # VACUUM cannot run inside a transaction block
+        with self.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.exec_driver_sql("VACUUM")
+    
+    def init_db(self, verbose: bool = False):
+        """
+        Initialize database with tables and indexes
+        
+        Args:
+            verbose: Print the created tables (used by the init_db script)
+        """
         self.create_tables()
-        print("✅ Database tables created successfully")
+        self.migrate_candle_timestamps()
+        self.migrate_details_columns()
+        self.create_missing_indexes()
+        self.analyze()
         
-        # Verify tables
-        from sqlalchemy import inspect
-        inspector = inspect(self.engine)
-        tables = inspector.get_table_names()
-        print(f"📊 Created {len(tables)} tables: {', '.join(tables)}")
+        if verbose:
+            print("✅ Database tables created successfully")
+            tables = inspect(self.engine).get_table_names()
+            print(f"📊 Created {len(tables)} tables: {', '.join(tables)}")
 
 
 # Global database instance
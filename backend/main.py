@@ -5,6 +5,7 @@ FastAPI application for trading system control and monitoring
 
 import sys
 import os
+import importlib.util
 from pathlib import Path
 
 # Add project root to Python path
@@ -12,14 +13,17 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from fastapi import FastAPI, HTTPException
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 import uvicorn
 from contextlib import asynccontextmanager
 
+from backend.api.middleware import FastPathCORSMiddleware
 from backend.api.routes import trading, agents, data, performance, chat
 from backend.websocket.routes import websocket_router
 from backend.config import Config
+from backend.core.cache import close_cache
+from backend.core.log_config import setup_logging, shutdown_logging
+from backend.database import start_batch_writers, stop_batch_writers
 
 # Load configuration
 config = Config()
@@ -29,14 +33,23 @@ config = Config()
 async def lifespan(app: FastAPI):
     """Lifespan context manager for startup and shutdown events"""
     # Startup
+    setup_logging()
     print("🚀 Starting KeenAI-Quant Backend API...")
     print(f"   Environment: {config.get('environment', 'development')}")
     print(f"   Trading pairs: {', '.join(config.trading.pairs)}")
+    start_batch_writers()
     
     yield
     
     # Shutdown
     print("🛑 Shutting down KeenAI-Quant Backend API...")
+    await stop_batch_writers()
+    await close_cache()
+    # AI modules load lazily; close their HTTP pool only if they were used
+    openrouter = sys.modules.get("AI_Core.models.openrouter")
+    if openrouter is not None:
+        await openrouter.close_client()
+    shutdown_logging()
 
 
 # Create FastAPI app
@@ -44,12 +57,15 @@ app = FastAPI(
     title="KeenAI-Quant API",
     description="AI-Powered Quantitative Trading System for 4 Pairs",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS configuration - Allow frontend to communicate with backend
+# Polled endpoints get precomputed headers; other paths use the standard CORSMiddleware
 app.add_middleware(
-    CORSMiddleware,
+    FastPathCORSMiddleware,
+    fast_paths=("/", "/health"),
     allow_origins=[
         "http://localhost:3000",
         "http://127.0.0.1:3000",
@@ -99,18 +115,37 @@ async def health_check():
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"detail": f"Internal server error: {str(exc)}"}
     )
 
 
+def _server_options() -> dict:
+    """
+    Pick the fastest available event loop / HTTP parser and the worker count
+    
+    WEB_CONCURRENCY > 1 runs several worker processes. Each worker holds its own
+    orchestrator, backtest results and WebSocket connections, so keep a single
+    worker while live trading runs inside the API process.
+    """
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+    return {
+        # uvloop / httptools are C implementations; uvloop is unavailable on Windows
+        "loop": "uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        "http": "httptools" if importlib.util.find_spec("httptools") else "h11",
+        "workers": workers,
+        # Auto-reload only supports a single worker
+        "reload": workers == 1,
+    }
+
+
 if __name__ == "__main__":
     # Run the server
     uvicorn.run(
         "backend.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
-        log_level="info"
+        log_level="info",
+        **_server_options()
     )
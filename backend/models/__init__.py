@@ -5,23 +5,29 @@ Data models for KeenAI-Quant trading system
 from .trading_models import (
     Tick,
     Candle,
+    CandleSeries,
     TradingSignal,
     Order,
     Position,
+    PositionBook,
     Account,
     AgentPrediction,
     EnsembleDecision,
+    IndicatorState,
     MarketContext
 )
 
 __all__ = [
     'Tick',
     'Candle',
+    'CandleSeries',
     'TradingSignal',
     'Order',
     'Position',
+    'PositionBook',
     'Account',
     'AgentPrediction',
     'EnsembleDecision',
+    'IndicatorState',
     'MarketContext'
 ]
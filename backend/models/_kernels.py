@@ -0,0 +1,49 @@
+"""
+Numeric kernels for batched trading-model math
+Compiled with Numba when it is installed, plain NumPy array code otherwise
+"""
+
+import numpy as np
+
+# Optional JIT compiler - the kernels are valid NumPy code without it
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, fastmath=True)
+def pnl_vec(entry, current, size, direction, out):
+    """
+    Unrealized P&L for a batch of positions
+    
+    Args:
+        entry: Entry prices
+        current: Current prices
+        size: Position sizes
+        direction: +1 for BUY, -1 for SELL
+        out: Array the result is written into
+        
+    Returns:
+        out
+    """
+    out[:] = (current - entry) * size * direction
+    return out
+
+
+@njit(cache=True)
+def validate_candles(open_, high, low, close):
+    """
+    Check OHLC consistency for a batch of candles
+    
+    Returns:
+        Boolean mask, True where high >= max(open, close) and low <= min(open, close)
+    """
+    return (high >= np.maximum(open_, close)) & (low <= np.minimum(open_, close))
@@ -1,12 +1,40 @@
 """
 Core trading data models for KeenAI-Quant
-All models use dataclasses for simplicity and performance
+All models use slotted dataclasses for simplicity and performance:
+no per-instance __dict__, smaller objects and faster attribute access
 """
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from collections import deque
+from typing import Optional, List, Dict, Any, Tuple, Union
 from enum import Enum
+import time
+import numpy as np
+
+from ._kernels import pnl_vec
+
+# Default timestamps of per-event models (signals, predictions, decisions,
+# contexts) share one datetime per millisecond. Set to False where every
+# object must carry its own exact datetime.now(); orders always do.
+COALESCE_TIMESTAMPS = True
+COALESCE_WINDOW = 0.001  # seconds
+
+_cached_now = datetime.now()
+_cached_mono = time.monotonic()
+
+
+def _now_coalesced() -> datetime:
+    """datetime.now(), reused for calls within COALESCE_WINDOW of each other"""
+    global _cached_now, _cached_mono
+    if not COALESCE_TIMESTAMPS:
+        return datetime.now()
+    
+    mono = time.monotonic()
+    if mono - _cached_mono >= COALESCE_WINDOW:
+        _cached_now = datetime.now()
+        _cached_mono = mono
+    return _cached_now
 
 
 class OrderDirection(str, Enum):
@@ -16,6 +44,14 @@ class OrderDirection(str, Enum):
     HOLD = "HOLD"
 
 
+# Integer tags for hot arithmetic; the Enum stays the API representation
+DIRECTION_SIGN = {
+    OrderDirection.BUY: 1,
+    OrderDirection.SELL: -1,
+    OrderDirection.HOLD: 0
+}
+
+
 class OrderType(str, Enum):
     """Order type"""
     MARKET = "MARKET"
@@ -33,7 +69,7 @@ class OrderStatus(str, Enum):
     REJECTED = "REJECTED"
 
 
-@dataclass
+@dataclass(slots=True)
 class Tick:
     """Real-time tick data"""
     pair: str
@@ -53,7 +89,7 @@ class Tick:
         return self.ask - self.bid
 
 
-@dataclass
+@dataclass(slots=True)
 class Candle:
     """OHLCV candle data"""
     pair: str
@@ -65,30 +101,155 @@ class Candle:
     close: float
     volume: float
     
+    # Derived once in __post_init__; candles are not modified after creation
+    is_bullish: bool = field(init=False, repr=False, compare=False)
+    body_size: float = field(init=False, repr=False, compare=False)
+    range_size: float = field(init=False, repr=False, compare=False)
+    
     def __post_init__(self):
-        """Validate candle data"""
+        """Validate candle data and derive body/range fields"""
         if self.high < max(self.open, self.close):
             raise ValueError(f"High {self.high} must be >= max(open, close)")
         if self.low > min(self.open, self.close):
             raise ValueError(f"Low {self.low} must be <= min(open, close)")
+        
+        self.is_bullish = self.close > self.open
+        self.body_size = abs(self.close - self.open)
+        self.range_size = self.high - self.low
+
+
+class CandleSeries:
+    """
+    Fixed-capacity OHLCV ring buffer for one pair and timeframe
+    
+    Rows live in a single (max_len, 5) float64 matrix with columns
+    [open, high, low, close, volume] plus a parallel datetime64 array, so
+    indicator code can work on contiguous columns. Hot paths should read
+    the column views (closes, highs, ...) or last_row(); Candle objects
+    are only built at the edges, when indexed, sliced (a slice returns a
+    list) or iterated.
+    """
+    
+    COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+    
+    def __init__(self, pair: str, timeframe: str, max_len: int = 100):
+        self.pair = pair
+        self.timeframe = timeframe
+        self.max_len = max_len
+        self.buf = np.empty((max_len, 5), dtype=np.float64)
+        self.timestamps = np.empty(max_len, dtype='datetime64[ns]')
+        self.head = 0  # Next row to write
+        self.count = 0
+    
+    @classmethod
+    def from_candles(cls, candles: List[Candle], max_len: Optional[int] = None) -> 'CandleSeries':
+        """Build a series holding the last max_len candles"""
+        first = candles[0] if candles else None
+        series = cls(
+            first.pair if first else '',
+            first.timeframe if first else '',
+            max_len or max(len(candles), 1)
+        )
+        for candle in candles[-series.max_len:]:
+            series.push(candle)
+        return series
+    
+    def push(self, candle: Candle):
+        """Append a candle, overwriting the oldest when full"""
+        row = self.head
+        self.buf[row] = (candle.open, candle.high, candle.low, candle.close, candle.volume)
+        self.timestamps[row] = np.datetime64(candle.timestamp, 'ns')
+        self.head = (row + 1) % self.max_len
+        if self.count < self.max_len:
+            self.count += 1
+    
+    append = push  # Drop-in for list/deque recent_candles
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def _row(self, i: int) -> int:
+        """Buffer row of the i-th oldest candle (negative indexes count from the newest)"""
+        if i < 0:
+            i += self.count
+        if not 0 <= i < self.count:
+            raise IndexError("CandleSeries index out of range")
+        return (self.head - self.count + i) % self.max_len
+    
+    def _candle(self, timestamp: np.datetime64, values: List[float]) -> Candle:
+        """Build a Candle from one buffer row"""
+        o, h, l, c, v = values
+        return Candle(
+            pair=self.pair,
+            timestamp=timestamp.astype('datetime64[us]').item(),
+            timeframe=self.timeframe,
+            open=o,
+            high=h,
+            low=l,
+            close=c,
+            volume=v
+        )
+    
+    def __getitem__(self, i: Union[int, slice]) -> Union[Candle, List[Candle]]:
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self.count))]
+        row = self._row(i)
+        return self._candle(self.timestamps[row], self.buf[row].tolist())
+    
+    def __iter__(self):
+        # One bulk conversion instead of a row lookup per candle
+        for timestamp, values in zip(self.times(), self.ohlcv().tolist()):
+            yield self._candle(timestamp, values)
+    
+    def times(self) -> np.ndarray:
+        """Timestamps oldest to newest (a view when not wrapped)"""
+        start = (self.head - self.count) % self.max_len
+        if start + self.count <= self.max_len:
+            return self.timestamps[start:start + self.count]
+        return np.concatenate((self.timestamps[start:], self.timestamps[:self.head]))
+    
+    def last_row(self) -> np.ndarray:
+        """Newest [open, high, low, close, volume] row as a view"""
+        return self.buf[self._row(-1)]
+    
+    def ohlcv(self) -> np.ndarray:
+        """Rows oldest to newest as an (N, 5) matrix (a view when not wrapped)"""
+        start = (self.head - self.count) % self.max_len
+        if start + self.count <= self.max_len:
+            return self.buf[start:start + self.count]
+        return np.concatenate((self.buf[start:], self.buf[:self.head]))
+    
+    def column(self, name: str) -> np.ndarray:
+        """One OHLCV column, oldest to newest"""
+        return self.ohlcv()[:, self.COLUMNS.index(name)]
+    
+    @property
+    def opens(self) -> np.ndarray:
+        """Open column view, oldest to newest"""
+        return self.ohlcv()[:, 0]
     
     @property
-    def is_bullish(self) -> bool:
-        """Check if candle is bullish"""
-        return self.close > self.open
+    def highs(self) -> np.ndarray:
+        """High column view, oldest to newest"""
+        return self.ohlcv()[:, 1]
     
     @property
-    def body_size(self) -> float:
-        """Calculate candle body size"""
-        return abs(self.close - self.open)
+    def lows(self) -> np.ndarray:
+        """Low column view, oldest to newest"""
+        return self.ohlcv()[:, 2]
     
     @property
-    def range_size(self) -> float:
-        """Calculate candle range"""
-        return self.high - self.low
+    def closes(self) -> np.ndarray:
+        """Close column view, oldest to newest"""
+        return self.ohlcv()[:, 3]
+    
+    @property
+    def volumes(self) -> np.ndarray:
+        """Volume column view, oldest to newest"""
+        return self.ohlcv()[:, 4]
 
 
-@dataclass
+@dataclass(slots=True)
 class TradingSignal:
     """Trading signal from AI or strategy"""
     pair: str
@@ -100,7 +261,8 @@ class TradingSignal:
     size: float
     reasoning: str
     source: str  # 'AI_ENSEMBLE', 'STRATEGY_TREND', etc.
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: datetime = field(default_factory=_now_coalesced)
+    _sign: int = field(init=False, repr=False, compare=False)  # +1 BUY, -1 SELL, 0 HOLD
     
     def __post_init__(self):
         """Validate signal"""
@@ -108,21 +270,17 @@ class TradingSignal:
             raise ValueError(f"Confidence must be between 0 and 1, got {self.confidence}")
         if self.size <= 0:
             raise ValueError(f"Size must be positive, got {self.size}")
+        self._sign = DIRECTION_SIGN[self.direction]
     
     @property
     def risk_reward_ratio(self) -> float:
         """Calculate risk-reward ratio"""
-        if self.direction == OrderDirection.BUY:
-            risk = self.entry_price - self.stop_loss
-            reward = self.take_profit - self.entry_price
-        else:  # SELL
-            risk = self.stop_loss - self.entry_price
-            reward = self.entry_price - self.take_profit
-        
+        risk = (self.entry_price - self.stop_loss) * self._sign
+        reward = (self.take_profit - self.entry_price) * self._sign
         return reward / risk if risk > 0 else 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """Order representation"""
     order_id: str
@@ -150,7 +308,7 @@ class Order:
         return self.status in [OrderStatus.PENDING, OrderStatus.PARTIALLY_FILLED]
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Open position"""
     position_id: str
@@ -163,14 +321,16 @@ class Position:
     take_profit: float
     unrealized_pnl: float
     opened_at: datetime
+    _sign: int = field(init=False, repr=False, compare=False)  # +1 BUY, -1 SELL
+    
+    def __post_init__(self):
+        """Cache the direction as an integer sign"""
+        self._sign = DIRECTION_SIGN[self.direction]
     
     @property
     def pnl_percentage(self) -> float:
         """Calculate P&L as percentage"""
-        if self.direction == OrderDirection.BUY:
-            return ((self.current_price - self.entry_price) / self.entry_price) * 100
-        else:  # SELL
-            return ((self.entry_price - self.current_price) / self.entry_price) * 100
+        return ((self.current_price - self.entry_price) / self.entry_price) * 100 * self._sign
     
     @property
     def is_profitable(self) -> bool:
@@ -180,13 +340,77 @@ class Position:
     def update_price(self, new_price: float):
         """Update current price and recalculate P&L"""
         self.current_price = new_price
-        if self.direction == OrderDirection.BUY:
-            self.unrealized_pnl = (new_price - self.entry_price) * self.size
-        else:  # SELL
-            self.unrealized_pnl = (self.entry_price - new_price) * self.size
+        self.unrealized_pnl = (new_price - self.entry_price) * self.size * self._sign
+
+
+class PositionBook:
+    """
+    Open positions laid out as parallel NumPy arrays (struct of arrays)
+    
+    Position objects remain the API representation; the book keeps their
+    numeric fields side by side so a price update recomputes every
+    position's P&L in one array expression instead of a Python loop.
+    """
+    
+    def __init__(self, positions: Optional[List[Position]] = None):
+        positions = positions or []
+        self.pairs: List[str] = [p.pair for p in positions]
+        self.index: Dict[str, int] = {pair: i for i, pair in enumerate(self.pairs)}
+        self.entry_price = np.array([p.entry_price for p in positions], dtype=np.float64)
+        self.current_price = np.array([p.current_price for p in positions], dtype=np.float64)
+        self.size = np.array([p.size for p in positions], dtype=np.float64)
+        # +1 for BUY, -1 for SELL
+        self.direction = np.array([p._sign for p in positions], dtype=np.int8)
+        self.unrealized_pnl = np.array([p.unrealized_pnl for p in positions], dtype=np.float64)
+    
+    def __len__(self) -> int:
+        return len(self.pairs)
+    
+    def update_prices(self, prices: np.ndarray):
+        """Set current prices (in book order) and recalculate P&L"""
+        self.current_price[:] = prices
+        self._recalculate()
+    
+    def set_prices(self, price_updates: Dict[str, float]) -> bool:
+        """
+        Set current prices by pair and recalculate P&L
+        
+        Args:
+            price_updates: Dictionary mapping pair to current price
+            
+        Returns:
+            True if any position in the book was updated
+        """
+        prices = self.current_price.copy()
+        updated = False
+        for pair, price in price_updates.items():
+            i = self.index.get(pair)
+            if i is not None:
+                prices[i] = price
+                updated = True
+        if updated:
+            self.update_prices(prices)
+        return updated
+    
+    def _recalculate(self):
+        """Recompute unrealized P&L for every position in place"""
+        pnl_vec(self.entry_price, self.current_price, self.size, self.direction, self.unrealized_pnl)
+    
+    @property
+    def total_unrealized_pnl(self) -> float:
+        """Total unrealized P&L across the book"""
+        return float(self.unrealized_pnl.sum())
+    
+    def apply_to(self, positions: Dict[str, Position]):
+        """Write current prices and P&L back to the Position objects"""
+        for i, pair in enumerate(self.pairs):
+            position = positions.get(pair)
+            if position is not None:
+                position.current_price = float(self.current_price[i])
+                position.unrealized_pnl = float(self.unrealized_pnl[i])
 
 
-@dataclass
+@dataclass(slots=True)
 class Account:
     """Account information"""
     balance: float
@@ -215,14 +439,14 @@ class Account:
         return self.realized_pnl_today + self.unrealized_pnl
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentPrediction:
     """Prediction from a single AI agent"""
     agent_name: str
     signal: OrderDirection
     confidence: float  # 0.0 to 1.0
     reasoning: str
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: datetime = field(default_factory=_now_coalesced)
     
     def __post_init__(self):
         """Validate prediction"""
@@ -230,14 +454,14 @@ class AgentPrediction:
             raise ValueError(f"Confidence must be between 0 and 1, got {self.confidence}")
 
 
-@dataclass
+@dataclass(slots=True)
 class EnsembleDecision:
     """Combined decision from multiple AI agents"""
     signal: OrderDirection
     confidence: float  # Weighted average confidence
     agent_votes: Dict[str, AgentPrediction]
     weights_used: Dict[str, float]
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: datetime = field(default_factory=_now_coalesced)
     
     @property
     def agreement_score(self) -> float:
@@ -258,31 +482,192 @@ class EnsembleDecision:
         return list(self.agent_votes.keys())
 
 
-@dataclass
+@dataclass(slots=True)
+class IndicatorState:
+    """
+    Running state for moving-average style indicators
+    
+    Each new close updates the values in O(1) using the recurrences
+    SMA[t] = SMA[t-1] + (close[t] - close[t-w]) / w and
+    EMA[t] = close[t] * k + EMA[t-1] * (1 - k), instead of rescanning the
+    window. Definitions match TechnicalIndicators (EMAs seeded from the
+    first close, RSI from the mean gain/loss of the last `rsi_period` moves)
+    and the indicator keys match calculate_indicators.
+    """
+    sma_periods: Tuple[int, ...] = (20, 50, 200)
+    ema_periods: Tuple[int, ...] = (9, 21, 55)
+    rsi_period: int = 14
+    macd_periods: Tuple[int, int, int] = (12, 26, 9)  # fast, slow, signal
+    count: int = 0
+    closes: deque = field(init=False, repr=False)
+    sma_sums: Dict[int, float] = field(init=False, repr=False)
+    emas: Dict[int, float] = field(init=False, repr=False)
+    gains: deque = field(init=False, repr=False)
+    losses: deque = field(init=False, repr=False)
+    gain_sum: float = 0.0
+    loss_sum: float = 0.0
+    macd_signal: float = 0.0
+    
+    def __post_init__(self):
+        """Allocate the rolling windows"""
+        # Closes are kept for the longest SMA so the expiring value is at hand
+        self.closes = deque(maxlen=max(self.sma_periods))
+        self.sma_sums = {period: 0.0 for period in self.sma_periods}
+        fast, slow, _ = self.macd_periods
+        self.emas = {period: 0.0 for period in (*self.ema_periods, fast, slow)}
+        self.gains = deque(maxlen=self.rsi_period)
+        self.losses = deque(maxlen=self.rsi_period)
+    
+    @classmethod
+    def from_candles(cls, candles: List[Candle], **kwargs) -> 'IndicatorState':
+        """Build state by replaying a candle history"""
+        return cls.from_closes([candle.close for candle in candles], **kwargs)
+    
+    @classmethod
+    def from_closes(cls, closes, **kwargs) -> 'IndicatorState':
+        """Build state by replaying a sequence of close prices"""
+        state = cls(**kwargs)
+        for close in closes:
+            state.update(float(close))
+        return state
+    
+    def update(self, close: float) -> Dict[str, float]:
+        """
+        Advance every indicator by one close
+        
+        Args:
+            close: Close price of the new candle
+            
+        Returns:
+            Indicator values that have enough history to be defined
+        """
+        closes = self.closes
+        n = len(closes)
+        
+        # SMA: add the new close, drop the one leaving each window
+        for period in self.sma_periods:
+            self.sma_sums[period] += close
+            if n >= period:
+                self.sma_sums[period] -= closes[-period]
+        
+        # RSI: rolling sums of the last rsi_period gains and losses
+        if n:
+            delta = close - closes[-1]
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+            if len(self.gains) == self.rsi_period:
+                self.gain_sum -= self.gains[0]
+                self.loss_sum -= self.losses[0]
+            self.gains.append(gain)
+            self.losses.append(loss)
+            self.gain_sum += gain
+            self.loss_sum += loss
+        
+        # EMAs (including the MACD legs) seeded from the first close
+        fast, slow, signal = self.macd_periods
+        if self.count == 0:
+            for period in self.emas:
+                self.emas[period] = close
+        else:
+            for period, previous in self.emas.items():
+                k = 2 / (period + 1)
+                self.emas[period] = close * k + previous * (1 - k)
+        
+        macd_line = self.emas[fast] - self.emas[slow]
+        if self.count == 0:
+            self.macd_signal = macd_line
+        else:
+            k = 2 / (signal + 1)
+            self.macd_signal = macd_line * k + self.macd_signal * (1 - k)
+        
+        closes.append(close)
+        self.count += 1
+        return self.values()
+    
+    def values(self) -> Dict[str, float]:
+        """Current indicator values that have enough history to be defined"""
+        count = self.count
+        values = {}
+        
+        for period in self.sma_periods:
+            if count >= period:
+                values[f'sma_{period}'] = self.sma_sums[period] / period
+        for period in self.ema_periods:
+            if count >= period:
+                values[f'ema_{period}'] = self.emas[period]
+        
+        if count >= self.rsi_period + 1:
+            if self.loss_sum <= 0:
+                values[f'rsi_{self.rsi_period}'] = 100.0
+            else:
+                rs = self.gain_sum / self.loss_sum
+                values[f'rsi_{self.rsi_period}'] = 100 - (100 / (1 + rs))
+        
+        fast, slow, signal = self.macd_periods
+        if count >= slow + signal:
+            macd_line = self.emas[fast] - self.emas[slow]
+            values['macd'] = macd_line
+            values['macd_signal'] = self.macd_signal
+            values['macd_histogram'] = macd_line - self.macd_signal
+        
+        return values
+
+
+@dataclass(slots=True)
 class MarketContext:
     """Market context for AI analysis"""
     pair: str
     current_price: float
     indicators: Dict[str, float]  # RSI, MACD, etc.
-    recent_candles: List[Candle]
+    recent_candles: Union[CandleSeries, List[Candle]]
     current_positions: List[Position]
     account_balance: float
     market_regime: str  # 'trending', 'ranging', 'volatile'
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: datetime = field(default_factory=_now_coalesced)
+    indicator_state: Optional[IndicatorState] = field(default=None, repr=False, compare=False)
+    
+    def push_candle(self, candle: Candle):
+        """
+        Append a new candle and update indicators incrementally
+        
+        recent_candles should be bounded (a CandleSeries as built by
+        ContextBuilder, or a deque with maxlen) so the oldest candle drops
+        off in O(1).
+        """
+        if self.indicator_state is None:
+            if isinstance(self.recent_candles, CandleSeries):
+                closes = self.recent_candles.closes
+            else:
+                closes = [c.close for c in self.recent_candles]
+            self.indicator_state = IndicatorState.from_closes(closes)
+        
+        self.recent_candles.append(candle)
+        self.current_price = candle.close
+        self.indicators.update(self.indicator_state.update(candle.close))
+        self.indicators['current_price'] = candle.close
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for AI API calls"""
+        latest = None
+        if isinstance(self.recent_candles, CandleSeries):
+            # Read the newest row directly instead of building a Candle
+            if self.recent_candles:
+                o, h, l, c, _ = self.recent_candles.last_row().tolist()
+                latest = {'open': o, 'high': h, 'low': l, 'close': c}
+        elif self.recent_candles:
+            candle = self.recent_candles[-1]
+            latest = {
+                'open': candle.open,
+                'high': candle.high,
+                'low': candle.low,
+                'close': candle.close,
+            }
         return {
             'pair': self.pair,
             'current_price': self.current_price,
             'indicators': self.indicators,
             'candle_count': len(self.recent_candles),
-            'latest_candle': {
-                'open': self.recent_candles[-1].open if self.recent_candles else None,
-                'high': self.recent_candles[-1].high if self.recent_candles else None,
-                'low': self.recent_candles[-1].low if self.recent_candles else None,
-                'close': self.recent_candles[-1].close if self.recent_candles else None,
-            } if self.recent_candles else None,
+            'latest_candle': latest,
             'position_count': len(self.current_positions),
             'account_balance': self.account_balance,
             'market_regime': self.market_regime,
@@ -3,113 +3,136 @@ WebSocket Connection Manager
 Manages WebSocket connections and broadcasts
 """
 
-from typing import List, Dict
+from typing import Dict, Optional, Set
+from collections import defaultdict
 from fastapi import WebSocket
 import asyncio
-import json
+import logging
+import orjson
 from datetime import datetime
 
+# orjson encodes datetimes (naive, same text as isoformat()) and NumPy values natively
+JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY
+
+logger = logging.getLogger(__name__)
+
 
 class ConnectionManager:
     """Manages WebSocket connections"""
     
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
-        self.subscriptions: Dict[str, List[WebSocket]] = {}
+        self.active_connections: Set[WebSocket] = set()
+        self.subscriptions: Dict[str, Set[WebSocket]] = defaultdict(set)
+        # Reverse index so disconnect only touches the socket's own topics
+        self.connection_topics: Dict[WebSocket, Set[str]] = {}
     
     async def connect(self, websocket: WebSocket):
         """Accept a new WebSocket connection"""
         await websocket.accept()
-        self.active_connections.append(websocket)
-        print(f"✅ WebSocket connected. Total connections: {len(self.active_connections)}")
+        self.active_connections.add(websocket)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("WebSocket connected. Total connections: %s", len(self.active_connections))
     
     def disconnect(self, websocket: WebSocket):
         """Remove a WebSocket connection"""
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        self.active_connections.discard(websocket)
         
-        # Remove from all subscriptions
-        for topic in self.subscriptions:
-            if websocket in self.subscriptions[topic]:
-                self.subscriptions[topic].remove(websocket)
+        # Remove from the subscriptions it holds
+        for topic in self.connection_topics.pop(websocket, ()):
+            self.subscriptions[topic].discard(websocket)
         
-        print(f"❌ WebSocket disconnected. Total connections: {len(self.active_connections)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("WebSocket disconnected. Total connections: %s", len(self.active_connections))
     
     def subscribe(self, websocket: WebSocket, topic: str):
         """Subscribe a connection to a topic"""
-        if topic not in self.subscriptions:
-            self.subscriptions[topic] = []
-        
-        if websocket not in self.subscriptions[topic]:
-            self.subscriptions[topic].append(websocket)
-            print(f"📡 Subscribed to topic: {topic}")
+        subscribers = self.subscriptions[topic]
+        if websocket not in subscribers:
+            subscribers.add(websocket)
+            self.connection_topics.setdefault(websocket, set()).add(topic)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Subscribed to topic: %s", topic)
     
     def unsubscribe(self, websocket: WebSocket, topic: str):
         """Unsubscribe a connection from a topic"""
-        if topic in self.subscriptions and websocket in self.subscriptions[topic]:
-            self.subscriptions[topic].remove(websocket)
-            print(f"📴 Unsubscribed from topic: {topic}")
+        subscribers = self.subscriptions.get(topic)
+        if subscribers and websocket in subscribers:
+            subscribers.discard(websocket)
+            self.connection_topics.get(websocket, set()).discard(topic)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Unsubscribed from topic: %s", topic)
     
     async def send_personal_message(self, message: dict, websocket: WebSocket):
         """Send a message to a specific connection"""
         try:
-            await websocket.send_json(message)
+            await websocket.send_text(orjson.dumps(message, option=JSON_OPTIONS).decode())
         except Exception as e:
-            print(f"❌ Error sending message: {str(e)}")
+            logger.warning("Error sending message: %s", e)
             self.disconnect(websocket)
     
     async def broadcast(self, message: dict, topic: str = None):
         """Broadcast a message to all connections or specific topic"""
-        connections = self.subscriptions.get(topic, []) if topic else self.active_connections
+        targets = self.subscriptions.get(topic) if topic else self.active_connections
+        if not targets:
+            return
         
-        disconnected = []
-        for connection in connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                print(f"❌ Error broadcasting: {str(e)}")
-                disconnected.append(connection)
+        # Snapshot the set: disconnects during the sends below mutate it
+        connections = tuple(targets)
+        
+        # Encode once for every subscriber; sent as a text frame so browser
+        # clients keep receiving strings they can JSON.parse
+        payload = orjson.dumps(message, option=JSON_OPTIONS).decode()
+        results = await asyncio.gather(
+            *(connection.send_text(payload) for connection in connections),
+            return_exceptions=True
+        )
         
         # Clean up disconnected connections
-        for connection in disconnected:
-            self.disconnect(connection)
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                logger.warning("Error broadcasting: %s", result)
+                self.disconnect(connection)
+    
+    # The broadcast helpers take an optional pre-formatted ISO timestamp so a
+    # loop emitting several messages per tick formats the time only once;
+    # otherwise the datetime is formatted by orjson during encoding
     
-    async def broadcast_price_update(self, pair: str, price: float):
+    async def broadcast_price_update(self, pair: str, price: float, ts: Optional[str] = None):
         """Broadcast price update"""
         message = {
             "type": "price_update",
             "data": {
                 "pair": pair,
                 "price": price,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": ts or datetime.now()
             }
         }
         await self.broadcast(message, topic="prices")
     
-    async def broadcast_position_update(self, position: dict):
+    async def broadcast_position_update(self, position: dict, ts: Optional[str] = None):
         """Broadcast position update"""
         message = {
             "type": "position_update",
             "data": position,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": ts or datetime.now()
         }
         await self.broadcast(message, topic="positions")
     
-    async def broadcast_trade_execution(self, trade: dict):
+    async def broadcast_trade_execution(self, trade: dict, ts: Optional[str] = None):
         """Broadcast trade execution"""
         message = {
             "type": "trade_executed",
             "data": trade,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": ts or datetime.now()
         }
         await self.broadcast(message, topic="trades")
     
-    async def broadcast_system_status(self, status: dict):
+    async def broadcast_system_status(self, status: dict, ts: Optional[str] = None):
         """Broadcast system status"""
         message = {
             "type": "system_status",
             "data": status,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": ts or datetime.now()
         }
         await self.broadcast(message, topic="status")
 
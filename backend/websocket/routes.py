@@ -4,15 +4,23 @@ Real-time data streaming via WebSocket
 """
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from functools import lru_cache
 import asyncio
-import json
+import orjson
+from datetime import datetime
 
 from backend.websocket.manager import manager
-from main_orchestrator import main_orchestrator
 
 websocket_router = APIRouter()
 
 
+@lru_cache(maxsize=1)
+def _orchestrator():
+    """Main orchestrator, imported on first use"""
+    from main_orchestrator import main_orchestrator
+    return main_orchestrator
+
+
 @websocket_router.websocket("/stream")
 async def websocket_endpoint(websocket: WebSocket):
     """
@@ -37,7 +45,7 @@ async def websocket_endpoint(websocket: WebSocket):
         # Handle incoming messages
         while True:
             data = await websocket.receive_text()
-            message = json.loads(data)
+            message = orjson.loads(data)
             
             # Handle subscription requests
             if message.get("action") == "subscribe":
@@ -77,9 +85,12 @@ async def start_price_broadcaster():
             # Get current prices from main orchestrator
             # This would be connected to Data Engine
             # For now, just broadcast system status
-            if main_orchestrator.state.value == "RUNNING":
-                status = main_orchestrator.get_system_status()
-                await manager.broadcast_system_status(status)
+            orchestrator = _orchestrator()
+            if orchestrator.state.value == "RUNNING":
+                # One timestamp per tick, shared by every message sent in it
+                ts = datetime.now().isoformat()
+                status = orchestrator.get_system_status()
+                await manager.broadcast_system_status(status, ts=ts)
             
             await asyncio.sleep(1)  # Broadcast every second
         except Exception as e:
@@ -5,6 +5,7 @@ Coordinates all system components and manages trading lifecycle
 
 import asyncio
 import logging
+import time
 from enum import Enum
 from typing import Dict, Any, Optional
 from datetime import datetime
@@ -32,6 +33,9 @@ class MainOrchestrator:
         """Initialize main orchestrator"""
         self.state = SystemState.STOPPED
         self.start_time: Optional[datetime] = None
+        # Monotonic start for uptime; start_time is kept for display only
+        self._start_monotonic: Optional[float] = None
+        self._start_time_iso: Optional[str] = None
         self.error_message: Optional[str] = None
         
         # Component managers
@@ -40,6 +44,11 @@ class MainOrchestrator:
         self.order_manager = None
         self.agent_orchestrator = None
         
+        # Equity snapshots feed /performance/equity-curve; one per minute keeps
+        # the 30-day window at ~43k rows instead of one row per 5s loop tick
+        self.snapshot_interval = 60.0
+        self._last_snapshot: Optional[float] = None
+        
         logger.info("Main Orchestrator initialized")
     
     async def start_trading(self):
@@ -54,14 +63,16 @@ class MainOrchestrator:
             # Start trading loop
             self.state = SystemState.RUNNING
             self.start_time = datetime.now()
+            self._start_monotonic = time.monotonic()
+            self._start_time_iso = self.start_time.isoformat()
             
-            logger.info("✅ Trading system started successfully")
+            logger.info("Trading system started successfully")
             
             # Run main trading loop
             await self._trading_loop()
             
         except Exception as e:
-            logger.error(f"Error starting trading system: {e}")
+            logger.error("Error starting trading system: %s", e)
             self.state = SystemState.ERROR
             self.error_message = str(e)
             raise
@@ -76,10 +87,10 @@ class MainOrchestrator:
             await self._shutdown_components()
             
             self.state = SystemState.STOPPED
-            logger.info("✅ Trading system stopped")
+            logger.info("Trading system stopped")
             
         except Exception as e:
-            logger.error(f"Error stopping trading system: {e}")
+            logger.error("Error stopping trading system: %s", e)
             self.state = SystemState.ERROR
             self.error_message = str(e)
             raise
@@ -108,6 +119,10 @@ class MainOrchestrator:
             self.position_manager = position_manager
             self.order_manager = order_manager
             
+            # Drain queued AI decisions, logs and risk events in this process too
+            from backend.database import start_batch_writers
+            start_batch_writers()
+            
             # Initialize account
             self.account_manager.update_account()
             
@@ -117,7 +132,7 @@ class MainOrchestrator:
             logger.info("Components initialized successfully")
             
         except Exception as e:
-            logger.error(f"Error initializing components: {e}")
+            logger.error("Error initializing components: %s", e)
             raise
     
     async def _shutdown_components(self):
@@ -127,10 +142,14 @@ class MainOrchestrator:
             if self.account_manager:
                 self.account_manager.stop_auto_update()
             
+            # Write out anything still queued before the loop goes away
+            from backend.database import stop_batch_writers
+            await stop_batch_writers()
+            
             logger.info("Components shutdown successfully")
             
         except Exception as e:
-            logger.error(f"Error shutting down components: {e}")
+            logger.error("Error shutting down components: %s", e)
             raise
     
     async def _trading_loop(self):
@@ -139,7 +158,8 @@ class MainOrchestrator:
             try:
                 # Update account and positions
                 if self.account_manager:
-                    self.account_manager.update_account()
+                    if self.account_manager.update_account():
+                        await self._record_equity_snapshot()
                 
                 if self.position_manager:
                     self.position_manager.update_positions()
@@ -148,9 +168,35 @@ class MainOrchestrator:
                 await asyncio.sleep(5)
                 
             except Exception as e:
-                logger.error(f"Error in trading loop: {e}")
+                logger.error("Error in trading loop: %s", e)
                 await asyncio.sleep(5)
     
+    async def _record_equity_snapshot(self):
+        """Persist the current account equity, at most once per snapshot_interval"""
+        now = time.monotonic()
+        if self._last_snapshot is not None and now - self._last_snapshot < self.snapshot_interval:
+            return
+        
+        account = self.account_manager.get_account()
+        if account is None:
+            return
+        
+        try:
+            from backend.database import db
+            from backend.database.dal import PerformanceDAL
+            
+            async with db.get_async_session() as session:
+                await PerformanceDAL.record_snapshot(
+                    session,
+                    balance=account.balance,
+                    equity=account.equity,
+                    margin_used=account.margin_used,
+                    unrealized_pnl=account.unrealized_pnl
+                )
+            self._last_snapshot = now
+        except Exception as e:
+            logger.warning("Failed to record equity snapshot: %s", e)
+    
     def get_system_status(self) -> Dict[str, Any]:
         """
         Get current system status
@@ -159,13 +205,13 @@ class MainOrchestrator:
             Dictionary with system status information
         """
         uptime = None
-        if self.start_time:
-            uptime = (datetime.now() - self.start_time).total_seconds()
+        if self._start_monotonic is not None:
+            uptime = time.monotonic() - self._start_monotonic
         
         status = {
             'state': self.state.value,
             'uptime_seconds': uptime,
-            'start_time': self.start_time.isoformat() if self.start_time else None,
+            'start_time': self._start_time_iso,
             'error_message': self.error_message,
             'components': {
                 'account_manager': self.account_manager is not None,
@@ -187,10 +233,9 @@ class MainOrchestrator:
         
         # Add position info if available
         if self.position_manager:
-            positions = self.position_manager.get_all_positions()
             status['positions'] = {
-                'count': len(positions),
-                'total_pnl': sum(p.unrealized_pnl for p in positions)
+                'count': len(self.position_manager.positions),
+                'total_pnl': self.position_manager.total_unrealized_pnl
             }
         
         return status
@@ -212,14 +257,13 @@ class MainOrchestrator:
             'win_rate': 0.0
         }
         
-        if self.start_time:
-            metrics['uptime_seconds'] = (datetime.now() - self.start_time).total_seconds()
+        if self._start_monotonic is not None:
+            metrics['uptime_seconds'] = time.monotonic() - self._start_monotonic
         
         # Add position metrics
         if self.position_manager:
-            positions = self.position_manager.get_all_positions()
-            metrics['open_positions'] = len(positions)
-            metrics['total_unrealized_pnl'] = sum(p.unrealized_pnl for p in positions)
+            metrics['open_positions'] = len(self.position_manager.positions)
+            metrics['total_unrealized_pnl'] = self.position_manager.total_unrealized_pnl
         
         return metrics
 
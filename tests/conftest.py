@@ -0,0 +1,40 @@
+"""
+Shared pytest fixtures for KeenAI-Quant
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+from typing import List
+
+import pytest
+
+# Tests import the packages from the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def make_candles(n: int, pair: str = 'EUR/USD', timeframe: str = '1m', start: float = 1.1) -> List:
+    """Deterministic zig-zag candle history, one per minute from 2024-01-01"""
+    from backend.models.trading_models import Candle
+    
+    t0 = datetime(2024, 1, 1)
+    candles = []
+    for i in range(n):
+        close = start + 0.001 * i + (0.002 if i % 3 == 0 else -0.0015 if i % 3 == 1 else 0.0)
+        candles.append(Candle(
+            pair=pair,
+            timestamp=t0 + timedelta(minutes=i),
+            timeframe=timeframe,
+            open=close - 0.0005,
+            high=close + 0.001,
+            low=close - 0.001,
+            close=close,
+            volume=100.0 + i
+        ))
+    return candles
+
+
+@pytest.fixture
+def candles():
+    """250 candles: enough history for every indicator, including SMA 200"""
+    return make_candles(250)
@@ -0,0 +1,218 @@
+"""
+Tests for the response cache decorators (backend/core/cache.py)
+"""
+
+import asyncio
+
+import pytest
+
+cache = pytest.importorskip("backend.core.cache")
+
+from fastapi import HTTPException
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis.asyncio hash commands the cache uses"""
+    
+    def __init__(self):
+        self.hashes = {}
+    
+    async def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+    
+    def hset(self, key, mapping):
+        self.hashes[key] = {
+            field.encode(): value if isinstance(value, bytes) else str(value).encode()
+            for field, value in mapping.items()
+        }
+    
+    def expire(self, key, ttl):
+        pass
+    
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc):
+        return False
+    
+    def __getattr__(self, name):
+        return getattr(self.client, name)
+    
+    async def execute(self):
+        pass
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    client = FakeRedis()
+    monkeypatch.setattr(cache, '_get_client', lambda: client)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_cached_serves_repeat_calls_from_redis(redis):
+    calls = 0
+    
+    @cache.cached(ttl=5)
+    async def endpoint(pair: str = 'EUR/USD'):
+        nonlocal calls
+        calls += 1
+        return {'pair': pair, 'calls': calls}
+    
+    first = await endpoint(pair='EUR/USD')
+    second = await endpoint(pair='EUR/USD')
+    
+    assert calls == 1
+    assert first.body == second.body == b'{"pair":"EUR/USD","calls":1}'
+    
+    await endpoint(pair='BTC/USD')
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_falls_back_to_stale_copy_on_server_error(redis):
+    fail = False
+    
+    @cache.cached(ttl=5)
+    async def endpoint():
+        if fail:
+            raise HTTPException(status_code=500, detail="MT5 down")
+        return {'balance': 1000}
+    
+    await endpoint()
+    # Fresh entry expired, endpoint now failing
+    redis.hashes.pop(cache._build_key(endpoint.__wrapped__, {}))
+    fail = True
+    
+    response = await endpoint()
+    assert response.body == b'{"balance":1000}'
+
+
+@pytest.mark.asyncio
+async def test_cached_does_not_mask_client_errors(redis):
+    @cache.cached(ttl=5)
+    async def endpoint():
+        raise HTTPException(status_code=404, detail="unknown pair")
+    
+    redis.hset(f"{cache._build_key(endpoint.__wrapped__, {})}:stale", {'body': b'{}', 'status': 200})
+    
+    with pytest.raises(HTTPException) as exc:
+        await endpoint()
+    assert exc.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_cached_runs_uncached_without_redis(monkeypatch):
+    monkeypatch.setattr(cache, '_get_client', lambda: None)
+    
+    @cache.cached(ttl=5)
+    async def endpoint():
+        return {'ok': True}
+    
+    assert await endpoint() == {'ok': True}
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_one_call():
+    calls = 0
+    
+    @cache.single_flight(ttl=10)
+    async def endpoint():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return {'calls': calls}
+    
+    results = await asyncio.gather(*(endpoint() for _ in range(5)))
+    
+    assert calls == 1
+    assert all(result == {'calls': 1} for result in results)
+    
+    # Reused within the ttl
+    assert await endpoint() == {'calls': 1}
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_single_flight_result_expires_after_ttl():
+    calls = 0
+    
+    @cache.single_flight(ttl=0.05)
+    async def endpoint():
+        nonlocal calls
+        calls += 1
+        return calls
+    
+    assert await endpoint() == 1
+    await asyncio.sleep(0.1)
+    assert await endpoint() == 2
+
+
+@pytest.mark.asyncio
+async def test_single_flight_keys_on_query_parameters():
+    calls = []
+    
+    @cache.single_flight(ttl=10)
+    async def endpoint(pair: str = 'EUR/USD'):
+        calls.append(pair)
+        return pair
+    
+    assert await endpoint(pair='EUR/USD') == 'EUR/USD'
+    assert await endpoint(pair='BTC/USD') == 'BTC/USD'
+    assert await endpoint(pair='EUR/USD') == 'EUR/USD'
+    assert calls == ['EUR/USD', 'BTC/USD']
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_errors_without_caching_them():
+    calls = 0
+    
+    @cache.single_flight(ttl=10)
+    async def endpoint():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.02)
+        if calls == 1:
+            raise ValueError("upstream down")
+        return 'ok'
+    
+    results = await asyncio.gather(endpoint(), endpoint(), return_exceptions=True)
+    assert calls == 1
+    assert all(isinstance(result, ValueError) for result in results)
+    
+    assert await endpoint() == 'ok'
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_single_flight_cancelled_leader_does_not_cancel_waiters():
+    calls = 0
+    
+    @cache.single_flight(ttl=10)
+    async def endpoint():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return 'done'
+    
+    leader = asyncio.create_task(endpoint())
+    await asyncio.sleep(0.01)
+    waiter = asyncio.create_task(endpoint())
+    await asyncio.sleep(0.01)
+    
+    leader.cancel()
+    assert await waiter == 'done'
+    assert leader.cancelled()
+    assert calls == 1
+    
+    # The completed result is still cached for later callers
+    assert await endpoint() == 'done'
+    assert calls == 1
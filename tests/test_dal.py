@@ -0,0 +1,250 @@
+"""
+Round-trip tests for the DAL (backend/database/dal.py) on SQLite via aiosqlite
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest_asyncio = pytest.importorskip("pytest_asyncio")
+pytest.importorskip("aiosqlite")
+dal = pytest.importorskip("backend.database.dal")
+
+from sqlalchemy import func, select
+
+from backend.database.schema import (
+    Database, HistoricalCandle, AgentPerformance, StrategyPerformance, SystemLog, to_epoch
+)
+from backend.models.trading_models import AgentPrediction, OrderDirection
+from tests.conftest import make_candles
+
+
+@pytest_asyncio.fixture
+async def database(tmp_path, monkeypatch):
+    """Fresh SQLite database that the DAL and its batch writers write to"""
+    database = Database(f"sqlite:///{tmp_path / 'keenai.db'}")
+    database.create_tables()
+    monkeypatch.setattr(dal, 'db', database)
+    dal._candle_cache.clear()
+    dal._decision_cache.clear()
+    yield database
+    await dal.stop_batch_writers()
+    await database.async_engine.dispose()
+    database.engine.dispose()
+
+
+async def _count(session, model) -> int:
+    return await session.scalar(select(func.count()).select_from(model))
+
+
+@pytest.mark.asyncio
+async def test_bulk_insert_skips_duplicates(database):
+    candles = make_candles(10)
+    
+    async with database.get_async_session() as session:
+        await dal.CandleDAL.insert_candles_bulk(session, candles[:6])
+        # Overlaps the first batch on candles 3-5
+        await dal.CandleDAL.insert_candles_bulk(session, candles[3:], batch_size=2)
+        
+        assert await _count(session, HistoricalCandle) == 10
+        
+        rows = await dal.CandleDAL.get_recent_candles(session, 'EUR/USD', '1m', limit=3)
+        assert [row.timestamp for row in rows] == [to_epoch(c.timestamp) for c in reversed(candles[-3:])]
+        assert rows[0].close == candles[-1].close
+
+
+@pytest.mark.asyncio
+async def test_insert_invalidates_cached_reads(database):
+    candles = make_candles(4)
+    
+    async with database.get_async_session() as session:
+        await dal.CandleDAL.insert_candles_bulk(session, candles[:2])
+        assert len(await dal.CandleDAL.get_recent_candles(session, 'EUR/USD', '1m')) == 2
+        
+        await dal.CandleDAL.insert_candles_bulk(session, candles[2:])
+        assert len(await dal.CandleDAL.get_recent_candles(session, 'EUR/USD', '1m')) == 4
+
+
+@pytest.mark.asyncio
+async def test_candles_range_round_trip(database):
+    candles = make_candles(20)
+    
+    async with database.get_async_session() as session:
+        await dal.CandleDAL.insert_candles_bulk(session, candles)
+        rows = await dal.CandleDAL.get_candles_range(
+            session, 'EUR/USD', '1m', candles[5].timestamp, candles[9].timestamp
+        )
+        
+        assert [row.timestamp for row in rows] == [to_epoch(c.timestamp) for c in candles[5:10]]
+        assert [row.close for row in rows] == [c.close for c in candles[5:10]]
+
+
+@pytest.mark.asyncio
+async def test_iter_candles_range_matches_range_read(database):
+    candles = make_candles(20)
+    
+    async with database.get_async_session() as session:
+        await dal.CandleDAL.insert_candles_bulk(session, candles)
+        start, end = candles[5].timestamp, candles[14].timestamp
+        rows = await dal.CandleDAL.get_candles_range(session, 'EUR/USD', '1m', start, end)
+        
+        streamed = [
+            row async for row in dal.CandleDAL.iter_candles_range(
+                session, 'EUR/USD', '1m', start, end, chunk=3
+            )
+        ]
+        assert [(row.timestamp, row.close) for row in streamed] == [(row.timestamp, row.close) for row in rows]
+        assert len(streamed) == 10
+
+
+@pytest.mark.asyncio
+async def test_agent_performance_update_keeps_one_row_per_day(database):
+    async with database.get_async_session() as session:
+        await dal.AgentPerformanceDAL.update_performance(
+            session, 'keen', {'total_signals': 3, 'win_rate': 0.5}
+        )
+        await dal.AgentPerformanceDAL.update_performance(
+            session, 'keen', {'total_signals': 7, 'win_rate': 0.75}
+        )
+        
+        assert await _count(session, AgentPerformance) == 1
+        history = await dal.AgentPerformanceDAL.get_agent_performance(session, 'keen')
+        assert [(p.total_signals, p.win_rate) for p in history] == [(7, 0.75)]
+
+
+@pytest.mark.asyncio
+async def test_upsert_falls_back_to_select_on_other_dialects(database, monkeypatch):
+    # Dialects without INSERT ... ON CONFLICT take the SELECT-then-write path
+    monkeypatch.setattr(dal, '_dialect_insert', lambda session, table: None)
+    
+    async with database.get_async_session() as session:
+        await dal.AgentPerformanceDAL.update_performance(session, 'keen', {'total_signals': 1})
+        await dal.AgentPerformanceDAL.update_performance(session, 'keen', {'total_signals': 2})
+        
+        assert await _count(session, AgentPerformance) == 1
+        history = await dal.AgentPerformanceDAL.get_agent_performance(session, 'keen')
+        assert [p.total_signals for p in history] == [2]
+
+
+@pytest.mark.asyncio
+async def test_strategy_performance_update_keys_on_pair(database):
+    async with database.get_async_session() as session:
+        await dal.StrategyPerformanceDAL.update_performance(
+            session, 'mean_reversion', 'EUR/USD', {'total_trades': 1}
+        )
+        await dal.StrategyPerformanceDAL.update_performance(
+            session, 'mean_reversion', 'BTC/USD', {'total_trades': 2}
+        )
+        await dal.StrategyPerformanceDAL.update_performance(
+            session, 'mean_reversion', 'EUR/USD', {'total_trades': 5}
+        )
+        
+        assert await _count(session, StrategyPerformance) == 2
+        rows = await dal.StrategyPerformanceDAL.get_strategy_performance(
+            session, 'mean_reversion', pair='EUR/USD'
+        )
+        assert [row.total_trades for row in rows] == [5]
+
+
+@pytest.mark.asyncio
+async def test_trade_lifecycle(database):
+    async with database.get_async_session() as session:
+        await dal.TradeDAL.insert_trade(session, {
+            'trade_id': 'T-1',
+            'pair': 'EUR/USD',
+            'direction': 'BUY',
+            'size': 1000.0,
+            'entry_price': 1.1,
+            'stop_loss': 1.09,
+            'take_profit': 1.12,
+            'opened_at': datetime.now() - timedelta(minutes=5),
+            'status': 'OPEN'
+        })
+        
+        assert [t.trade_id for t in await dal.TradeDAL.get_open_trades(session, 'EUR/USD')] == ['T-1']
+        
+        await dal.TradeDAL.update_trade(session, 'T-1', {
+            'status': 'CLOSED',
+            'exit_price': 1.11,
+            'pnl': 10.0,
+            'closed_at': datetime.now()
+        })
+        
+        assert await dal.TradeDAL.get_open_trades(session) == []
+        recent = await dal.TradeDAL.get_recent_trades(session, limit=10)
+        assert recent[0]['trade_id'] == 'T-1' and recent[0]['status'] == 'CLOSED'
+
+
+@pytest.mark.asyncio
+async def test_trading_loop_snapshots_feed_equity_curve(database, monkeypatch):
+    import backend.database
+    from backend.models.trading_models import Account
+    from main_orchestrator import MainOrchestrator
+    
+    monkeypatch.setattr(backend.database, 'db', database)
+    
+    class FakeAccountManager:
+        def get_account(self):
+            return Account(
+                balance=1000.0, equity=1010.0, margin_used=50.0,
+                margin_available=950.0, unrealized_pnl=10.0, realized_pnl_today=0.0
+            )
+    
+    orchestrator = MainOrchestrator()
+    orchestrator.account_manager = FakeAccountManager()
+    
+    # Throttled: back-to-back loop ticks write a single snapshot
+    await orchestrator._record_equity_snapshot()
+    await orchestrator._record_equity_snapshot()
+    
+    async with database.get_async_session() as session:
+        timestamps, equity, balance = await dal.PerformanceDAL.get_equity_curve(
+            session, datetime.now() - timedelta(days=1)
+        )
+    
+    assert len(timestamps) == 1
+    assert equity.tolist() == [1010.0] and balance.tolist() == [1000.0]
+
+
+@pytest.mark.asyncio
+async def test_batched_writes_are_flushed(database):
+    dal.AIDecisionDAL.log_decision(
+        'EUR/USD', 'keen',
+        AgentPrediction(agent_name='keen', signal=OrderDirection.BUY, confidence=0.8, reasoning='trend')
+    )
+    dal.SystemLogDAL.log('INFO', 'SYSTEM', 'started', details={'pairs': 4})
+    dal.RiskEventDAL.log_event('CIRCUIT_BREAKER', 'daily loss limit', pair='EUR/USD')
+    
+    # put() on a running loop starts the flush tasks without start_batch_writers()
+    assert all(writer._task is not None for writer in dal._BATCH_WRITERS)
+    
+    # Stopping drains whatever the background tasks have not written yet
+    await dal.stop_batch_writers()
+    
+    async with database.get_async_session() as session:
+        decisions = await dal.AIDecisionDAL.get_recent_decisions(session, 'keen')
+        assert [(d.pair, d.signal, d.confidence) for d in decisions] == [('EUR/USD', 'BUY', 0.8)]
+        
+        logs = await dal.SystemLogDAL.get_logs(session, category='SYSTEM')
+        assert [(log['message'], log['details']) for log in logs] == [('started', {'pairs': 4})]
+        
+        events = await dal.RiskEventDAL.get_unresolved_events(session)
+        assert [(e.event_type, e.pair) for e in events] == [('CIRCUIT_BREAKER', 'EUR/USD')]
+        
+        await dal.RiskEventDAL.resolve_event(session, events[0].id)
+        assert await dal.RiskEventDAL.get_unresolved_events(session) == []
+
+
+def test_batch_writer_is_bounded_without_event_loop():
+    writer = dal._BatchWriter(SystemLog, maxlen=3)
+    for n in range(5):
+        writer.put({'message': str(n)})
+    
+    assert writer._task is None
+    assert [row['message'] for row in writer._buffer] == ['2', '3', '4']
+    assert writer.dropped == 2
+
+
+def test_audit_writers_are_unbounded():
+    assert dal._decision_writer._buffer.maxlen is None
+    assert dal._risk_event_writer._buffer.maxlen is None
@@ -0,0 +1,133 @@
+"""
+Tests for the EventBus (backend/core/events.py)
+"""
+
+import asyncio
+
+import pytest
+
+events = pytest.importorskip("backend.core.events")
+EventBus = events.EventBus
+EventType = events.EventType
+
+
+@pytest.mark.asyncio
+async def test_history_is_bounded_and_filtered():
+    bus = EventBus()
+    bus._event_history = type(bus._event_history)(maxlen=5)
+    
+    for n in range(8):
+        event_type = EventType.TRADE_OPENED if n % 2 else EventType.TRADE_CLOSED
+        await bus.publish(event_type, {'n': n})
+    
+    assert [e.data['n'] for e in bus.get_history()] == [3, 4, 5, 6, 7]
+    assert [e.data['n'] for e in bus.get_history(EventType.TRADE_OPENED)] == [3, 5, 7]
+    assert [e.data['n'] for e in bus.get_history(limit=2)] == [6, 7]
+    assert [e.data['n'] for e in bus.get_history(limit=0)] == [3, 4, 5, 6, 7]
+    assert [e.data['n'] for e in bus.get_history(EventType.TRADE_OPENED, limit=0)] == [3, 5, 7]
+
+
+@pytest.mark.asyncio
+async def test_publish_runs_sync_and_async_subscribers():
+    bus = EventBus()
+    received = []
+    
+    def on_sync(event):
+        received.append(('sync', event.data['n']))
+    
+    async def on_async(event):
+        received.append(('async', event.data['n']))
+    
+    bus.subscribe(EventType.TRADE_OPENED, on_sync)
+    bus.subscribe(EventType.TRADE_OPENED, on_async)
+    await bus.publish(EventType.TRADE_OPENED, {'n': 1})
+    
+    assert sorted(received) == [('async', 1), ('sync', 1)]
+
+
+@pytest.mark.asyncio
+async def test_async_subscribers_run_concurrently():
+    bus = EventBus()
+    first_started, second_started = asyncio.Event(), asyncio.Event()
+    finished = []
+    
+    # Each callback waits for the other to start, which only works concurrently
+    async def first(event):
+        first_started.set()
+        await asyncio.wait_for(second_started.wait(), timeout=1)
+        finished.append('first')
+    
+    async def second(event):
+        second_started.set()
+        await asyncio.wait_for(first_started.wait(), timeout=1)
+        finished.append('second')
+    
+    bus.subscribe(EventType.SIGNAL_GENERATED, first)
+    bus.subscribe(EventType.SIGNAL_GENERATED, second)
+    await bus.publish(EventType.SIGNAL_GENERATED, {})
+    
+    assert sorted(finished) == ['first', 'second']
+
+
+@pytest.mark.asyncio
+async def test_failing_callback_does_not_stop_others():
+    bus = EventBus()
+    calls = []
+    
+    def broken(event):
+        raise RuntimeError("boom")
+    
+    async def broken_async(event):
+        raise RuntimeError("boom")
+    
+    bus.subscribe(EventType.ERROR_OCCURRED, broken)
+    bus.subscribe(EventType.ERROR_OCCURRED, broken_async)
+    bus.subscribe(EventType.ERROR_OCCURRED, lambda event: calls.append(event.type))
+    
+    await bus.publish(EventType.ERROR_OCCURRED, {})
+    assert calls == [EventType.ERROR_OCCURRED]
+
+
+@pytest.mark.asyncio
+async def test_unsubscribe_during_publish_uses_snapshot():
+    bus = EventBus()
+    calls = []
+    
+    def first(event):
+        calls.append('first')
+        bus.unsubscribe(EventType.TRADE_CLOSED, second)
+    
+    def second(event):
+        calls.append('second')
+    
+    bus.subscribe(EventType.TRADE_CLOSED, first)
+    bus.subscribe(EventType.TRADE_CLOSED, second)
+    
+    # The in-flight publish still notifies everyone subscribed when it started
+    await bus.publish(EventType.TRADE_CLOSED, {})
+    assert calls == ['first', 'second']
+    
+    await bus.publish(EventType.TRADE_CLOSED, {})
+    assert calls == ['first', 'second', 'first']
+
+
+@pytest.mark.asyncio
+async def test_subscribe_during_publish_applies_to_next_event():
+    bus = EventBus()
+    calls = []
+    
+    def late(event):
+        calls.append('late')
+    
+    def early(event):
+        calls.append('early')
+        if len(calls) == 1:
+            bus.subscribe(EventType.PRICE_ALERT, late)
+    
+    bus.subscribe(EventType.PRICE_ALERT, early)
+    
+    await bus.publish(EventType.PRICE_ALERT, {})
+    assert calls == ['early']
+    
+    await bus.publish(EventType.PRICE_ALERT, {})
+    assert calls == ['early', 'early', 'late']
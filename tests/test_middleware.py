@@ -0,0 +1,84 @@
+"""
+Tests for the CORS fast path (backend/api/middleware.py)
+"""
+
+import pytest
+
+pytest.importorskip("starlette")
+FastPathCORSMiddleware = pytest.importorskip("backend.api.middleware").FastPathCORSMiddleware
+
+
+async def _app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"app"})
+
+
+def _middleware(**options):
+    return FastPathCORSMiddleware(
+        _app,
+        allow_origins=["http://localhost:3000"],
+        allow_methods=options.pop("allow_methods", ["GET", "POST"]),
+        **options
+    )
+
+
+async def _request(middleware, method, path, headers):
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "headers": [(k.encode(), v.encode()) for k, v in headers.items()]
+    }
+    messages = []
+    
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+    
+    async def send(message):
+        messages.append(message)
+    
+    await middleware(scope, receive, send)
+    return messages[0]["status"], dict(messages[0]["headers"])
+
+
+def _preflight(method, request_headers=None):
+    headers = {"origin": "http://localhost:3000", "access-control-request-method": method}
+    if request_headers:
+        headers["access-control-request-headers"] = request_headers
+    return headers
+
+
+@pytest.mark.asyncio
+async def test_preflight_for_allowed_method_uses_fast_path():
+    status, headers = await _request(_middleware(), "OPTIONS", "/health", _preflight("GET", "Content-Type"))
+    
+    assert status == 200
+    assert headers[b"access-control-allow-origin"] == b"http://localhost:3000"
+    assert headers[b"access-control-allow-methods"] == b"GET, POST"
+
+
+@pytest.mark.asyncio
+async def test_preflight_for_disallowed_method_is_rejected():
+    status, _ = await _request(_middleware(), "OPTIONS", "/health", _preflight("DELETE"))
+    
+    assert status == 400
+
+
+@pytest.mark.asyncio
+async def test_preflight_for_disallowed_header_is_rejected():
+    middleware = _middleware(allow_headers=["Authorization"])
+    
+    status, _ = await _request(middleware, "OPTIONS", "/health", _preflight("GET", "authorization"))
+    assert status == 200
+    
+    status, _ = await _request(middleware, "OPTIONS", "/health", _preflight("GET", "X-Secret"))
+    assert status == 400
+
+
+@pytest.mark.asyncio
+async def test_wildcard_headers_are_mirrored():
+    middleware = _middleware(allow_headers=["*"])
+    
+    status, headers = await _request(middleware, "OPTIONS", "/health", _preflight("POST", "X-Custom"))
+    assert status == 200
+    assert headers[b"access-control-allow-headers"] == b"X-Custom"
@@ -0,0 +1,186 @@
+"""
+Tests for the trading models (backend/models/trading_models.py)
+"""
+
+from collections import deque
+from datetime import datetime
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from backend.models.trading_models import (
+    CandleSeries, IndicatorState, MarketContext, OrderDirection, Position, PositionBook
+)
+from tests.conftest import make_candles
+
+
+def test_indicator_state_matches_technical_indicators(candles):
+    indicators = pytest.importorskip("Data_Engine.technical_analysis.indicators")
+    ti = indicators.TechnicalIndicators
+    
+    values = IndicatorState.from_candles(candles).values()
+    
+    for period in (20, 50, 200):
+        assert values[f'sma_{period}'] == pytest.approx(ti.sma(candles, period))
+    for period in (9, 21, 55):
+        assert values[f'ema_{period}'] == pytest.approx(ti.ema(candles, period))
+    assert values['rsi_14'] == pytest.approx(ti.rsi(candles, 14))
+    macd, signal, histogram = ti.macd(candles)
+    assert values['macd'] == pytest.approx(macd)
+    assert values['macd_signal'] == pytest.approx(signal)
+    assert values['macd_histogram'] == pytest.approx(histogram)
+
+
+def test_indicator_state_incremental_update_matches_replay(candles):
+    state = IndicatorState.from_candles(candles[:200])
+    for candle in candles[200:]:
+        incremental = state.update(candle.close)
+    
+    replayed = IndicatorState.from_candles(candles).values()
+    assert incremental.keys() == replayed.keys()
+    for key, value in replayed.items():
+        assert incremental[key] == pytest.approx(value)
+
+
+def test_indicator_state_omits_undefined_values():
+    values = IndicatorState.from_candles(make_candles(25)).values()
+    assert 'sma_20' in values and 'ema_21' in values and 'rsi_14' in values
+    assert 'sma_50' not in values and 'ema_55' not in values and 'macd' not in values
+
+
+def test_market_context_push_candle_rolls_window(candles):
+    context = MarketContext(
+        pair='EUR/USD',
+        current_price=candles[199].close,
+        indicators={},
+        recent_candles=deque(candles[100:200], maxlen=100),
+        current_positions=[],
+        account_balance=1000.0,
+        market_regime='ranging'
+    )
+    for candle in candles[200:]:
+        context.push_candle(candle)
+    
+    assert len(context.recent_candles) == 100
+    assert context.recent_candles[-1].close == candles[-1].close
+    assert context.current_price == candles[-1].close
+    assert context.indicators['current_price'] == candles[-1].close
+    assert context.indicators['ema_9'] == pytest.approx(
+        IndicatorState.from_candles(candles[100:]).values()['ema_9']
+    )
+
+
+def test_market_context_push_candle_rolls_candle_series(candles):
+    context = MarketContext(
+        pair='EUR/USD',
+        current_price=candles[199].close,
+        indicators={},
+        recent_candles=CandleSeries.from_candles(candles[:200], max_len=100),
+        current_positions=[],
+        account_balance=1000.0,
+        market_regime='ranging'
+    )
+    for candle in candles[200:]:
+        context.push_candle(candle)
+    
+    assert len(context.recent_candles) == 100
+    assert context.recent_candles[-1].close == candles[-1].close
+    assert context.current_price == candles[-1].close
+
+
+def test_candle_series_wraparound_keeps_newest_in_order():
+    candles = make_candles(25)
+    series = CandleSeries.from_candles(candles[:10], max_len=10)
+    for candle in candles[10:]:
+        series.push(candle)
+    
+    assert len(series) == 10
+    assert [c.close for c in series] == [c.close for c in candles[-10:]]
+    assert series[0].timestamp == candles[15].timestamp
+    assert series[-1].timestamp == candles[-1].timestamp
+    np.testing.assert_allclose(series.column('close'), [c.close for c in candles[-10:]])
+    assert series.ohlcv().shape == (10, 5)
+
+
+def test_candle_series_index_out_of_range():
+    series = CandleSeries.from_candles(make_candles(3), max_len=5)
+    with pytest.raises(IndexError):
+        series[3]
+    with pytest.raises(IndexError):
+        series[-4]
+
+
+def _position(pair: str, direction: OrderDirection, entry: float, size: float) -> Position:
+    return Position(
+        position_id=pair,
+        pair=pair,
+        direction=direction,
+        size=size,
+        entry_price=entry,
+        current_price=entry,
+        stop_loss=0.0,
+        take_profit=0.0,
+        unrealized_pnl=0.0,
+        opened_at=datetime(2024, 1, 1)
+    )
+
+
+def test_position_book_set_prices_recomputes_pnl():
+    positions = {
+        'EUR/USD': _position('EUR/USD', OrderDirection.BUY, 1.10, 1000.0),
+        'XAU/USD': _position('XAU/USD', OrderDirection.SELL, 2000.0, 2.0)
+    }
+    book = PositionBook(list(positions.values()))
+    
+    assert book.set_prices({'EUR/USD': 1.12, 'BTC/USD': 50000.0})
+    assert not book.set_prices({'BTC/USD': 51000.0})
+    book.update_prices(np.array([1.12, 1990.0]))
+    
+    np.testing.assert_allclose(book.unrealized_pnl, [20.0, 20.0])
+    assert book.total_unrealized_pnl == pytest.approx(40.0)
+    
+    book.apply_to(positions)
+    assert positions['XAU/USD'].current_price == 1990.0
+    assert positions['XAU/USD'].unrealized_pnl == pytest.approx(20.0)
+
+
+def test_candle_series_slicing_matches_list():
+    candles = make_candles(30)
+    series = CandleSeries.from_candles(candles, max_len=20)
+    expected = candles[-20:]
+    
+    for key in (slice(-5, None), slice(None, 3), slice(2, 12, 3), slice(None, None, -1)):
+        assert [c.close for c in series[key]] == [c.close for c in expected[key]]
+
+
+def test_candle_series_column_views_match_candles():
+    candles = make_candles(30)
+    series = CandleSeries.from_candles(candles, max_len=20)
+    expected = candles[-20:]
+    
+    assert series.closes.tolist() == [c.close for c in expected]
+    assert series.highs.tolist() == [c.high for c in expected]
+    assert series.times().astype('datetime64[us]').tolist() == [c.timestamp for c in expected]
+    assert series.last_row().tolist() == [
+        expected[-1].open, expected[-1].high, expected[-1].low, expected[-1].close, expected[-1].volume
+    ]
+    assert [c.timestamp for c in series] == [c.timestamp for c in expected]
+
+
+def test_market_context_to_dict_reads_latest_row(candles):
+    series = CandleSeries.from_candles(candles, max_len=100)
+    context = MarketContext(
+        pair='EUR/USD',
+        current_price=candles[-1].close,
+        indicators={},
+        recent_candles=series,
+        current_positions=[],
+        account_balance=1000.0,
+        market_regime='ranging'
+    )
+    
+    latest = candles[-1]
+    assert context.to_dict()['latest_candle'] == {
+        'open': latest.open, 'high': latest.high, 'low': latest.low, 'close': latest.close
+    }
@@ -0,0 +1,44 @@
+"""
+Tests for schema helpers and migrations (backend/database/schema.py)
+"""
+
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+schema = pytest.importorskip("backend.database.schema")
+
+from sqlalchemy import text
+
+
+def test_epoch_round_trip():
+    dt = datetime(2024, 1, 1, 12, 30)
+    assert schema.to_epoch(dt) == 1704112200
+    assert schema.from_epoch(schema.to_epoch(dt)) == dt
+
+
+def test_migrate_candle_timestamps_converts_datetime_text(tmp_path):
+    database = schema.Database(f"sqlite:///{tmp_path / 'legacy.db'}")
+    database.create_tables()
+    
+    # Rows written before the epoch migration stored DATETIME text
+    with database.engine.begin() as conn:
+        conn.execute(text(
+            "INSERT INTO historical_candles "
+            "(pair, timeframe, timestamp, open, high, low, close, volume) VALUES "
+            "('EUR/USD', '1m', '2024-01-01 00:00:00.000000', 1, 1, 1, 1, 1), "
+            "('EUR/USD', '1m', 1704067260, 1, 1, 1, 1, 1)"
+        ))
+    
+    database.migrate_candle_timestamps()
+    # Idempotent: already converted rows are left alone
+    database.migrate_candle_timestamps()
+    
+    with database.engine.connect() as conn:
+        rows = conn.execute(text(
+            "SELECT timestamp, typeof(timestamp) FROM historical_candles ORDER BY timestamp"
+        )).all()
+    database.engine.dispose()
+    
+    assert rows == [(1704067200, 'integer'), (1704067260, 'integer')]